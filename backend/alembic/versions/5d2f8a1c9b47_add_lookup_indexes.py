@@ -0,0 +1,70 @@
+"""Add lookup indexes
+
+Revision ID: 5d2f8a1c9b47
+Revises: 3869522ae0ca
+Create Date: 2026-10-18 10:12:37.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8a1c9b47'
+down_revision: Union[str, Sequence[str], None] = '3869522ae0ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_token',
+            'users',
+            ['token'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_users_created_at',
+            'users',
+            ['created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_users_unverified_created_at',
+            'users',
+            ['created_at'],
+            postgresql_where=sa.text('email_verified = false'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_messages_created_at',
+            'messages',
+            ['created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table, index in (
+            ('messages', 'ix_messages_created_at'),
+            ('users', 'ix_users_unverified_created_at'),
+            ('users', 'ix_users_created_at'),
+            ('users', 'ix_users_token'),
+        ):
+            op.drop_index(
+                index,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
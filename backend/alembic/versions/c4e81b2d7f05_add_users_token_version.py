@@ -0,0 +1,36 @@
+"""Add users.token_version
+
+Revision ID: c4e81b2d7f05
+Revises: a7c3e9d41f20
+Create Date: 2026-10-18 15:21:08.613207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e81b2d7f05'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e9d41f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'users',
+        sa.Column(
+            'token_version',
+            sa.Integer(),
+            server_default='0',
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
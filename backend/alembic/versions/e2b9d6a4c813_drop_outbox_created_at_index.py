@@ -0,0 +1,42 @@
+"""Drop outbox_messages created_at index
+
+Revision ID: e2b9d6a4c813
+Revises: c4e81b2d7f05
+Create Date: 2026-10-18 16:40:12.207415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b9d6a4c813'
+down_revision: Union[str, Sequence[str], None] = 'c4e81b2d7f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The publisher reads outbox rows by id; nothing filters or orders
+    # them by created_at, so the index only slowed down every insert.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_outbox_messages_created_at',
+            table_name='outbox_messages',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_outbox_messages_created_at',
+            'outbox_messages',
+            ['created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
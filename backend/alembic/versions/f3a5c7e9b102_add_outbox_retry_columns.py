@@ -0,0 +1,68 @@
+"""Add outbox retry columns
+
+Revision ID: f3a5c7e9b102
+Revises: e2b9d6a4c813
+Create Date: 2026-10-18 17:12:45.538190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a5c7e9b102'
+down_revision: Union[str, Sequence[str], None] = 'e2b9d6a4c813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'outbox_messages',
+        sa.Column(
+            'attempts',
+            sa.Integer(),
+            server_default='0',
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        'outbox_messages',
+        sa.Column(
+            'next_attempt_at',
+            sa.DateTime(),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        'outbox_messages',
+        sa.Column('dead_at', sa.DateTime(), nullable=True),
+    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_outbox_messages_pending',
+            'outbox_messages',
+            ['next_attempt_at'],
+            postgresql_where=sa.text('dead_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_outbox_messages_pending',
+            table_name='outbox_messages',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('outbox_messages', 'dead_at')
+    op.drop_column('outbox_messages', 'next_attempt_at')
+    op.drop_column('outbox_messages', 'attempts')
@@ -0,0 +1,81 @@
+"""Tokens signed and verified per second for each supported algorithm.
+
+Keys are generated in memory. The "RS256 (PEM)" row repeats the
+previous behaviour of handing PyJWT raw PEM text on every call.
+
+    cd backend && PYTHONPATH=src python benchmarks/bench_jwt.py
+"""
+
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from utils.jwt_keys import JWTKeyManager
+
+DURATION = 1.0  # seconds per measurement
+
+
+def payload() -> dict:
+    now = datetime.now(UTC)
+    return {"sub": "42", "iat": now, "exp": now + timedelta(minutes=15)}
+
+
+def rate(func) -> float:
+    count = 0
+    start = perf_counter()
+    while perf_counter() - start < DURATION:
+        func()
+        count += 1
+    return count / (perf_counter() - start)
+
+
+def pem_functions(private_key):
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+    token = jwt.encode(payload(), private_pem, algorithm="RS256")
+    return (
+        lambda: jwt.encode(payload(), private_pem, algorithm="RS256"),
+        lambda: jwt.decode(token, public_pem, algorithms=["RS256"]),
+    )
+
+
+def main():
+    keys = {
+        "RS256": rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=2048,
+        ),
+        "ES256": ec.generate_private_key(ec.SECP256R1()),
+        "EdDSA": ed25519.Ed25519PrivateKey.generate(),
+    }
+
+    print(f"{'algorithm':<12} {'sign/s':>10} {'verify/s':>10}")
+
+    sign, verify = pem_functions(keys["RS256"])
+    print(f"{'RS256 (PEM)':<12} {rate(sign):>10.0f} {rate(verify):>10.0f}")
+
+    for algorithm, private_key in keys.items():
+        manager = JWTKeyManager(
+            private_key=private_key,
+            public_key=private_key.public_key(),
+            algorithm=algorithm,
+            key_id="bench",
+        )
+        token = manager.encode(payload())
+        sign_rate = rate(lambda: manager.encode(payload()))
+        verify_rate = rate(lambda: manager.decode(token))
+        print(f"{algorithm:<12} {sign_rate:>10.0f} {verify_rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Per-request cost of MetricsMiddleware.
+
+Drives a bare ASGI app directly, with and without the middleware, so
+the difference is the instrumentation alone.
+
+    cd backend && PYTHONPATH=src python benchmarks/bench_metrics_middleware.py
+"""
+
+import asyncio
+from time import perf_counter
+
+from core.metrics import MetricsMiddleware
+
+ITERATIONS = 200_000
+
+
+class Route:
+    path_format = "/api/users/{user_id}"
+
+
+async def app(scope, receive, send):
+    scope["route"] = Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    return None
+
+
+async def measure(asgi_app) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/api/users/1"}
+    for _ in range(1000):
+        await asgi_app(dict(scope), receive, send)
+
+    start = perf_counter()
+    for _ in range(ITERATIONS):
+        await asgi_app(dict(scope), receive, send)
+    return (perf_counter() - start) / ITERATIONS
+
+
+async def main():
+    bare = await measure(app)
+    instrumented = await measure(MetricsMiddleware(app))
+    print(f"{ITERATIONS} requests")
+    print(f"without middleware: {bare * 1e6:6.2f} us/request")
+    print(f"   with middleware: {instrumented * 1e6:6.2f} us/request")
+    print(f"          overhead: {(instrumented - bare) * 1e6:6.2f} us/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
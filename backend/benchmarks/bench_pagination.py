@@ -0,0 +1,74 @@
+"""Deep-page latency of offset vs keyset pagination.
+
+Seeds a million rows into the messages table inside a transaction,
+pages through it with MessageRepository.get_all (OFFSET) and
+MessageRepository.get_after (keyset on id), then rolls everything
+back. Needs the Postgres configured in .env with migrations applied.
+
+    cd backend && PYTHONPATH=src python benchmarks/bench_pagination.py
+"""
+
+import asyncio
+from statistics import median
+from time import perf_counter
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import create_engine
+from entrypoint.config import config
+from models import Message
+from repositories import MessageRepository
+
+ROWS = 1_000_000
+LIMIT = 20
+DEPTHS = (0, 1_000, 10_000, 100_000, 500_000, 990_000)
+REPEATS = 5
+
+
+async def timed(coro_factory) -> float:
+    samples = []
+    for _ in range(REPEATS):
+        start = perf_counter()
+        await coro_factory()
+        samples.append(perf_counter() - start)
+    return median(samples)
+
+
+async def main():
+    engine = create_engine(config.database)
+    async with AsyncSession(engine) as session:
+        transaction = await session.begin()
+        try:
+            await session.execute(
+                text(
+                    "INSERT INTO messages (content) "
+                    "SELECT 'message ' || n FROM generate_series(1, :rows) n"
+                ),
+                {"rows": ROWS},
+            )
+            await session.execute(text("ANALYZE messages"))
+            first_id = await session.scalar(select(func.min(Message.id)))
+
+            repository = MessageRepository(session)
+            print(f"{ROWS} rows, page size {LIMIT}, median of {REPEATS}")
+            print(f"{'depth':>8} {'offset ms':>10} {'keyset ms':>10}")
+            for depth in DEPTHS:
+                offset_time = await timed(
+                    lambda: repository.get_all(depth, LIMIT),
+                )
+                after_id = first_id + depth - 1 if depth else None
+                keyset_time = await timed(
+                    lambda: repository.get_after(after_id, LIMIT),
+                )
+                print(
+                    f"{depth:>8} {offset_time * 1000:>10.2f} "
+                    f"{keyset_time * 1000:>10.2f}"
+                )
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,184 @@
+"""Per-request overhead of rate limiting a route.
+
+Compares the previous rate_limit decorator, which parsed the policy and
+scanned the arguments on every call, with RateLimitMiddleware, which
+matches a RoutePolicy compiled once at startup. The limiter is a stub,
+so only the work done around the limiter call is measured. Each
+overhead is relative to the same endpoint without rate limiting. The
+middleware also adds the X-RateLimit-* headers to every response,
+which the decorator never did.
+
+    cd backend && PYTHONPATH=src python benchmarks/bench_rate_limit.py
+"""
+
+import asyncio
+import re
+from functools import wraps
+from time import perf_counter
+
+from fastapi import HTTPException, Request, status
+
+from core.rate_limiter import (
+    RateLimiter,
+    RateLimitMiddleware,
+    RateLimitResult,
+    Strategy,
+    route_policy,
+)
+
+POLICY = "30/s;200/m;3000/h"
+ITERATIONS = 200_000
+
+SCOPE = {
+    "type": "http",
+    "method": "GET",
+    "path": "/api/ping",
+    "headers": [(b"x-forwarded-for", b"203.0.113.7, 10.0.0.1")],
+    "client": ("10.0.0.1", 50000),
+    "server": ("testserver", 80),
+    "scheme": "http",
+    "query_string": b"",
+}
+
+
+def legacy_rate_limit(
+    strategy: Strategy = Strategy.IP,
+    policy: str | None = None,
+):
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            request = None
+            for arg in args:
+                if isinstance(arg, Request):
+                    request = arg
+                    break
+            if request is None:
+                request = kwargs.get("request")
+            if request is None:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST)
+
+            if not policy or not re.match(
+                r"^(\d+\/[smhd])(;\d+\/[smhd]){0,2}$",
+                policy,
+            ):
+                raise ValueError(f"Invalid request policy: {policy}.")
+            request_policy = policy.split(";")
+
+            forwarded = request.headers.get("X-Forwarded-For")
+            if forwarded:
+                identifier = forwarded.split(",")[0].strip()
+            elif request.client:
+                identifier = request.client.host
+            else:
+                identifier = "unknown"
+
+            rate_limiter = kwargs.get("rate_limiter")
+            if rate_limiter is None:
+                for arg in args:
+                    if hasattr(arg, "is_limited"):
+                        rate_limiter = arg
+                        break
+
+            endpoint = request.url.path
+            windows = []
+            for rp in request_policy:
+                m = re.match(r"^(\d+)\/([smhd])$", rp)
+                max_requests = int(m.group(1))
+                unit = m.group(2)
+                if unit == "s":
+                    window_seconds = 1
+                elif unit == "m":
+                    window_seconds = 60
+                elif unit == "h":
+                    window_seconds = 60 * 60
+                else:
+                    window_seconds = 24 * 60 * 60
+                windows.append((max_requests, window_seconds))
+
+            if await rate_limiter.is_limited(identifier, endpoint, windows):
+                raise HTTPException(status_code=429)
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class StubRateLimiter:
+    result = RateLimitResult(
+        limited=False,
+        limit=30,
+        remaining=29,
+        retry_after=0,
+        window=1,
+    )
+
+    async def check(self, identifier, endpoint, windows) -> RateLimitResult:
+        return self.result
+
+    async def is_limited(self, identifier, endpoint, windows) -> bool:
+        return False
+
+
+async def handler(request: Request, rate_limiter: RateLimiter):
+    return None
+
+
+async def app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message):
+    return None
+
+
+async def measure(call) -> float:
+    for _ in range(1000):
+        await call()
+
+    start = perf_counter()
+    for _ in range(ITERATIONS):
+        await call()
+    return (perf_counter() - start) / ITERATIONS
+
+
+async def main():
+    request = Request(SCOPE)
+    limiter = StubRateLimiter()
+    decorated = legacy_rate_limit(Strategy.IP, POLICY)(handler)
+    middleware = RateLimitMiddleware(
+        app,
+        [route_policy("GET", "/api/ping", POLICY, strategy=Strategy.IP)],
+    )
+    middleware._rate_limiter = limiter
+
+    results = (
+        (
+            "before",
+            await measure(lambda: handler(request, limiter)),
+            await measure(lambda: decorated(request, limiter)),
+        ),
+        (
+            "after",
+            await measure(lambda: app(dict(SCOPE), receive, send)),
+            await measure(lambda: middleware(dict(SCOPE), receive, send)),
+        ),
+    )
+
+    print(f"policy: {POLICY}, {ITERATIONS} calls")
+    for name, baseline, limited in results:
+        overhead = (limited - baseline) * 1e6
+        print(
+            f"{name:>6}: {limited * 1e6:7.2f} us/call "
+            f"({overhead:.2f} us overhead)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
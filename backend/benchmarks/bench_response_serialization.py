@@ -0,0 +1,183 @@
+"""Requests per second of the list endpoints, validated vs trusted responses.
+
+Serves /api/users/ and /api/messages/ in-process from two apps whose
+services return the same page of ORM rows without touching a database:
+one renders pages the way the routers used to (response_model
+validation of every row, then the stock JSON response class), the
+other mounts the real routers, which encode the rows with trusted_rows
+and trusted_json and default to ORJSONResponse.
+
+    cd backend && PYTHONPATH=src \
+        python benchmarks/bench_response_serialization.py
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from time import perf_counter
+
+import httpx
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.integrations.fastapi import (
+    DishkaRoute,
+    FastapiProvider,
+    FromDishka,
+    setup_dishka,
+)
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.responses import ORJSONResponse
+
+from models import Message, RoleEnum, User
+from routers import root_router
+from schemas.message import MessageResponse
+from schemas.user import UserResponse
+from services import MessageService, UserService
+from utils.pagination import NEXT_CURSOR_HEADER, Page
+
+REQUESTS = 1_000
+PAGE_SIZES = (20, 100)
+
+ADMIN = UserResponse(
+    id=0,
+    email="admin@example.com",
+    username="admin",
+    role=RoleEnum.ADMIN,
+)
+NOW = datetime.now(timezone.utc)
+
+
+class FakeUserService:
+    def __init__(self, users: list[User]):
+        self.users = users
+
+    async def get_all_users(self, user, offset, limit, cursor):
+        return Page(items=self.users[:limit], next_cursor="bmV4dA")
+
+
+class FakeMessageService:
+    def __init__(self, messages: list[Message]):
+        self.messages = messages
+
+    async def get_all_msgs(self, offset, limit, cursor):
+        return Page(items=self.messages[:limit], next_cursor="bmV4dA")
+
+
+class BenchProvider(Provider):
+    scope = Scope.REQUEST
+
+    def __init__(self, users: list[User], messages: list[Message]):
+        super().__init__()
+        self.users = users
+        self.messages = messages
+
+    @provide
+    def get_user_service(self) -> UserService:
+        return FakeUserService(self.users)
+
+    @provide
+    def get_message_service(self) -> MessageService:
+        return FakeMessageService(self.messages)
+
+    @provide
+    def get_current_user(self) -> UserResponse:
+        return ADMIN
+
+
+def validated_router() -> APIRouter:
+    router = APIRouter(prefix="/api", route_class=DishkaRoute)
+
+    @router.get("/users/", response_model=list[UserResponse])
+    async def get_all_users(
+        response: Response,
+        service: FromDishka[UserService],
+        current_user: FromDishka[UserResponse],
+        offset: int = 0,
+        limit: int = 20,
+        cursor: str | None = None,
+    ):
+        page = await service.get_all_users(current_user, offset, limit, cursor)
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        return page.items
+
+    @router.get("/messages/", response_model=list[MessageResponse])
+    async def get_all_msg(
+        response: Response,
+        service: FromDishka[MessageService],
+        offset: int = 0,
+        limit: int = 20,
+        cursor: str | None = None,
+    ):
+        page = await service.get_all_msgs(offset, limit, cursor)
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        return page.items
+
+    return router
+
+
+def make_app(provider: Provider, trusted: bool) -> FastAPI:
+    if trusted:
+        app = FastAPI(default_response_class=ORJSONResponse)
+        app.include_router(root_router)
+    else:
+        app = FastAPI()
+        app.include_router(validated_router())
+    setup_dishka(make_async_container(provider, FastapiProvider()), app)
+    return app
+
+
+async def throughput(app: FastAPI, url: str) -> tuple[float, httpx.Response]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+    ) as client:
+        response = await client.get(url)
+        start = perf_counter()
+        for _ in range(REQUESTS):
+            await client.get(url)
+        return REQUESTS / (perf_counter() - start), response
+
+
+async def main():
+    users = [
+        User(
+            id=n,
+            email=f"user{n}@example.com",
+            username=f"user{n}",
+            role=RoleEnum.USER,
+        )
+        for n in range(1, max(PAGE_SIZES) + 1)
+    ]
+    messages = [
+        Message(
+            id=n,
+            content=f"benchmark message {n}",
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        for n in range(1, max(PAGE_SIZES) + 1)
+    ]
+    provider = BenchProvider(users, messages)
+    validated = make_app(provider, trusted=False)
+    trusted = make_app(provider, trusted=True)
+
+    print(f"{REQUESTS} sequential requests per row, in-process ASGI")
+    print(
+        f"{'endpoint':<30} {'validated/s':>12} {'trusted/s':>10} "
+        f"{'gain':>6}"
+    )
+    for path in ("/api/users/", "/api/messages/"):
+        for limit in PAGE_SIZES:
+            url = f"{path}?limit={limit}"
+            before, old = await throughput(validated, url)
+            after, new = await throughput(trusted, url)
+            # Same body and pagination header either way.
+            assert old.json() == new.json()
+            assert new.headers[NEXT_CURSOR_HEADER] == "bmV4dA"
+            print(
+                f"{url:<30} {before:>12.0f} {after:>10.0f} "
+                f"{after / before:>5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""Emails per second: one connection per email vs SMTPPool.
+
+Starts a minimal in-process SMTP server that answers every command after
+a simulated network round trip (and a few extra round trips on connect,
+standing in for the TLS handshake), then sends the same burst of emails
+with aiosmtplib.send, as the tasks used to, and through SMTPPool.
+
+    cd backend && PYTHONPATH=src python benchmarks/bench_smtp_pool.py
+"""
+
+import asyncio
+from email.message import EmailMessage
+from time import perf_counter
+
+import aiosmtplib
+
+from clients import SMTPPool
+
+RTT = 0.02  # seconds, a remote SMTP relay
+HANDSHAKE_ROUND_TRIPS = 3  # TCP + TLS 1.2
+EMAILS = 200
+CONCURRENCY = 20
+POOL_SIZES = (1, 8, CONCURRENCY)
+
+
+async def handle_client(reader, writer):
+    async def reply(line: str):
+        await asyncio.sleep(RTT)
+        writer.write(f"{line}\r\n".encode())
+        await writer.drain()
+
+    await asyncio.sleep(RTT * HANDSHAKE_ROUND_TRIPS)
+    await reply("220 localhost ESMTP")
+    try:
+        while line := await reader.readline():
+            command = line.decode().strip().upper()
+            if command.startswith("EHLO"):
+                await reply("250-localhost\r\n250 AUTH PLAIN LOGIN")
+            elif command.startswith("AUTH"):
+                await reply("235 2.7.0 Authentication successful")
+            elif command == "DATA":
+                await reply("354 End data with <CR><LF>.<CR><LF>")
+                while await reader.readline() != b".\r\n":
+                    pass
+                await reply("250 OK")
+            elif command == "QUIT":
+                await reply("221 Bye")
+                break
+            else:
+                await reply("250 OK")
+    finally:
+        writer.close()
+
+
+def make_message(n: int) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "bench@example.com"
+    message["To"] = f"user{n}@example.com"
+    message["Subject"] = "Verify Email"
+    message.set_content("Ваш код для входа:\n\n123456")
+    return message
+
+
+async def burst(send) -> float:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one(n: int):
+        async with semaphore:
+            await send(make_message(n))
+
+    start = perf_counter()
+    await asyncio.gather(*(one(n) for n in range(EMAILS)))
+    return EMAILS / (perf_counter() - start)
+
+
+async def main():
+    server = await asyncio.start_server(handle_client, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def send_per_email(message: EmailMessage):
+        await aiosmtplib.send(
+            message,
+            hostname="127.0.0.1",
+            port=port,
+            username="bench",
+            password="bench",
+        )
+
+    print(
+        f"{EMAILS} emails, {CONCURRENCY} concurrent tasks, "
+        f"simulated RTT {RTT * 1000:.0f} ms"
+    )
+    rate = await burst(send_per_email)
+    print(f"{'connection per email':<24} {rate:>8.1f}/s")
+    for size in POOL_SIZES:
+        pool = SMTPPool(
+            hostname="127.0.0.1",
+            port=port,
+            username="bench",
+            password="bench",
+            use_tls=False,
+            size=size,
+        )
+        rate = await burst(pool.send)
+        print(f"{f'SMTPPool(size={size})':<24} {rate:>8.1f}/s")
+        await pool.close()
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,182 @@
+"""Database round trips per write endpoint.
+
+Runs the service calls behind the message and user write endpoints
+against Postgres (asyncpg, the engine from core.database) and counts
+every statement sent to the server, including BEGIN/COMMIT and
+savepoints, plus the time each call takes. Everything happens inside
+an outer transaction that is rolled back. Needs the Postgres configured
+in .env with migrations applied.
+
+    cd backend && PYTHONPATH=src python benchmarks/bench_write_round_trips.py
+"""
+
+import asyncio
+import uuid
+from statistics import median
+from time import perf_counter
+
+from fastapi import HTTPException
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import create_engine
+from core.token_cache import TokenCache
+from core.uow import UnitOfWork
+from entrypoint.config import config
+from models import Message, RoleEnum, User
+from repositories import MessageRepository, UserRepository
+from schemas.message import MessageUpdate
+from schemas.user import UserResponse, UserUpdate
+from services.message import MessageService
+from services.user import UserService
+
+REPEATS = 50
+
+ADMIN = UserResponse(
+    id=0,
+    email="admin@example.com",
+    username="admin",
+    role=RoleEnum.ADMIN,
+)
+
+
+class RoundTripCounter:
+    def __init__(self, sync_engine):
+        self.count = 0
+        # Savepoints go through the cursor and are already counted by
+        # before_cursor_execute; BEGIN/COMMIT/ROLLBACK are not.
+        for name in ("before_cursor_execute", "begin", "commit", "rollback"):
+            event.listen(sync_engine, name, self._increment)
+
+    def _increment(self, *args, **kwargs):
+        self.count += 1
+
+
+def message_service(session: AsyncSession) -> MessageService:
+    return MessageService(UnitOfWork(session), MessageRepository(session))
+
+
+class NullTokenVersions:
+    # update_user caches the new version in Redis, which is not a
+    # database round trip.
+    async def set(self, user_id: int, version: int) -> None:
+        pass
+
+
+def user_service(session: AsyncSession) -> UserService:
+    # The password hasher, OTP store and outbox are not touched by the
+    # calls measured here.
+    return UserService(
+        UnitOfWork(session),
+        UserRepository(session),
+        password_hasher=None,
+        token_cache=TokenCache(max_size=1, ttl=1),
+        token_versions=NullTokenVersions(),
+        otp_repository=None,
+        outbox=None,
+    )
+
+
+async def measure(
+    counter: RoundTripCounter,
+    label: str,
+    call,
+    setup=None,
+) -> None:
+    samples = []
+    trips = 0
+    for _ in range(REPEATS):
+        argument = await setup() if setup is not None else None
+        counter.count = 0
+        start = perf_counter()
+        try:
+            await call(argument)
+        except HTTPException:
+            pass
+        samples.append(perf_counter() - start)
+        trips = counter.count
+    print(f"{label:<36} {trips:>6} {median(samples) * 1000:>9.3f}")
+
+
+async def main():
+    engine = create_engine(config.database)
+    counter = RoundTripCounter(engine.sync_engine)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            session = AsyncSession(
+                bind=connection,
+                join_transaction_mode="create_savepoint",
+                expire_on_commit=False,
+                autoflush=False,
+            )
+            message = Message(content="round trip benchmark")
+            user = User(
+                username="bench",
+                email=f"bench-{uuid.uuid4().hex}@example.com",
+                password="x",
+                token=uuid.uuid4(),
+            )
+            session.add_all([message, user])
+            await session.commit()
+
+            print(f"median of {REPEATS}")
+            print(f"{'endpoint':<36} {'trips':>6} {'ms':>9}")
+            await measure(
+                counter,
+                "PATCH /api/messages/{id}",
+                lambda _: message_service(session).update_msg(
+                    message.id,
+                    MessageUpdate(content=f"round trip {uuid.uuid4().hex}"),
+                ),
+            )
+            await measure(
+                counter,
+                "PUT /api/users/me",
+                lambda _: user_service(session).update_user(
+                    user_id=user.id,
+                    user_update=UserUpdate(username=uuid.uuid4().hex[:16]),
+                    user=ADMIN,
+                ),
+            )
+
+            async def unverify_user() -> None:
+                await session.execute(
+                    update(User)
+                    .where(User.id == user.id)
+                    .values(email_verified=False),
+                )
+                await session.commit()
+
+            await measure(
+                counter,
+                "GET /api/users/verify-email",
+                lambda _: user_service(session).verify_email(user.token),
+                setup=unverify_user,
+            )
+            await measure(
+                counter,
+                "DELETE /api/messages/{id} (missing)",
+                lambda _: message_service(session).delete_msg(-1),
+            )
+
+            async def create_message() -> int:
+                created = Message(content="round trip benchmark")
+                session.add(created)
+                await session.commit()
+                return created.id
+
+            await measure(
+                counter,
+                "DELETE /api/messages/{id}",
+                lambda msg_id: message_service(session).delete_msg(msg_id),
+                setup=create_message,
+            )
+            await session.close()
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,186 @@
+"""Fail when a repository query plans a sequential scan on a large table.
+
+Seeds the users and messages tables inside a transaction, runs every
+repository query while recording the SQL it sends, then EXPLAINs each
+recorded statement and exits non-zero if any plan contains a Seq Scan
+over a relation with more than --max-rows estimated rows. Everything is
+rolled back afterwards. Needs the Postgres configured in .env with
+migrations applied.
+
+    cd backend && PYTHONPATH=src python scripts/check_query_plans.py
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import uuid
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from core.database import create_engine
+from entrypoint.config import config
+from repositories import (
+    DatabaseOTPRepository,
+    MessageRepository,
+    UserRepository,
+)
+from schemas.message import MessageUpdate
+from schemas.user import UserCreate, UserUpdate
+
+SEED_ROWS = 50_000
+
+
+async def seed(session: AsyncSession, rows: int) -> None:
+    await session.execute(
+        text(
+            "INSERT INTO users "
+            "(username, email, password, role, email_verified, token) "
+            "SELECT 'user' || n, 'user' || n || '@plans.local', 'x', "
+            "'user', n % 10 = 0, gen_random_uuid() "
+            "FROM generate_series(1, :rows) n"
+        ),
+        {"rows": rows},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO messages (content) "
+            "SELECT 'message ' || n FROM generate_series(1, :rows) n"
+        ),
+        {"rows": rows},
+    )
+    await session.execute(text("ANALYZE users"))
+    await session.execute(text("ANALYZE messages"))
+
+
+async def run_repository_queries(session: AsyncSession) -> None:
+    users = UserRepository(session)
+    messages = MessageRepository(session)
+    otp = DatabaseOTPRepository(session)
+    user = await users.get_user_by_email("user42@plans.local")
+
+    await users.get(user.id)
+    await users.get_all(100, 20)
+    await users.get_after(user.id, 20)
+    await users.get_user_by_email_token(user.token)
+    await users.verify_email(user.token)
+    await users.update(user.id, UserUpdate(username="renamed"))
+    await otp.save(user.id, "secret")
+    await otp.get(user.id)
+    await otp.delete(user.id)
+    await users.create_if_absent(
+        UserCreate(
+            email=f"{uuid.uuid4().hex}@plans.local",
+            username="new",
+            password="x",
+        ),
+    )
+
+    message = (await messages.get_all(0, 1))[0]
+    await messages.get(message.id)
+    await messages.get_all(100, 20)
+    await messages.get_after(message.id, 20)
+    await messages.update(
+        message.id,
+        MessageUpdate(content="updated message"),
+    )
+    await messages.delete(message.id)
+
+
+def seq_scans(plan: dict):
+    if plan["Node Type"] == "Seq Scan":
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", ()):
+        yield from seq_scans(child)
+
+
+async def explain(
+    connection: AsyncConnection,
+    statement: str,
+    parameters,
+    max_rows: int,
+) -> list[str]:
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}",
+        parameters,
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    problems = []
+    for relation in seq_scans(plan[0]["Plan"]):
+        rows = await connection.scalar(
+            text(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = :name"
+            ),
+            {"name": relation},
+        )
+        if rows > max_rows:
+            problems.append(f"Seq Scan on {relation} (~{rows} rows)")
+    return problems
+
+
+async def main(max_rows: int) -> int:
+    engine = create_engine(config.database)
+    recorded: list[tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(
+            ("SELECT", "INSERT", "UPDATE", "DELETE"),
+        ):
+            recorded.append((statement, parameters))
+
+    failures = 0
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            session = AsyncSession(
+                bind=connection,
+                join_transaction_mode="create_savepoint",
+                autoflush=False,
+            )
+            await seed(session, SEED_ROWS)
+
+            event.listen(engine.sync_engine, "before_cursor_execute", record)
+            try:
+                await run_repository_queries(session)
+            finally:
+                event.remove(
+                    engine.sync_engine,
+                    "before_cursor_execute",
+                    record,
+                )
+
+            for statement, parameters in recorded:
+                problems = await explain(
+                    connection,
+                    statement,
+                    parameters,
+                    max_rows,
+                )
+                status = "FAIL" if problems else "ok"
+                print(f"[{status}] {' '.join(statement.split())[:100]}")
+                for problem in problems:
+                    print(f"       {problem}")
+                failures += bool(problems)
+            await session.close()
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+    print(f"{len(recorded)} statements checked, {failures} failing")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--max-rows",
+        type=int,
+        default=1_000,
+        help="largest table a query may scan sequentially",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.max_rows)))
@@ -1,5 +1,5 @@
-from clients.redis_client import RedisClient
+from clients.smtp_pool import SMTPPool
 
 __all__ = [
-    "RedisClient",
+    "SMTPPool",
 ]
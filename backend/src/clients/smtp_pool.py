@@ -0,0 +1,131 @@
+import asyncio
+import logging
+from collections import deque
+from email.message import EmailMessage
+from time import monotonic
+
+import aiosmtplib
+
+from entrypoint.config import EmailConfig
+
+logger = logging.getLogger(__name__)
+
+# Failures that say nothing about the message itself, only about the
+# session it was sent over, so the send is retried on a new connection.
+_CONNECTION_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPConnectError,
+    aiosmtplib.SMTPTimeoutError,
+    ConnectionError,
+)
+
+
+class SMTPPool:
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str | None = None,
+        password: str | None = None,
+        use_tls: bool = True,
+        size: int = 8,
+        timeout: float = 60,
+        noop_interval: float = 15,
+        max_idle: float = 60,
+        retries: int = 2,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.noop_interval = noop_interval
+        self.max_idle = max_idle
+        self.retries = retries
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle: deque[tuple[aiosmtplib.SMTP, float]] = deque()
+        self._closed = False
+
+    @classmethod
+    def from_config(cls, config: EmailConfig) -> "SMTPPool":
+        return cls(
+            hostname=config.HOST,
+            port=config.PORT,
+            username=config.USERNAME,
+            password=config.PASSWORD,
+            use_tls=config.USE_SSL,
+            size=config.POOL_SIZE,
+            timeout=config.TIMEOUT,
+            noop_interval=config.NOOP_INTERVAL,
+            max_idle=config.MAX_IDLE,
+            retries=config.SEND_RETRIES,
+        )
+
+    async def send(self, message: EmailMessage) -> None:
+        # At most `size` sessions send at once. While the task queue is
+        # deep every slot hands its session straight to the next message,
+        # so a burst is drained over a few already authenticated sessions.
+        async with self._semaphore:
+            for attempt in range(self.retries + 1):
+                smtp = None
+                try:
+                    smtp = await self._acquire()
+                    await smtp.send_message(message)
+                except _CONNECTION_ERRORS:
+                    if smtp is not None:
+                        smtp.close()
+                    if attempt == self.retries:
+                        raise
+                    logger.warning("SMTP session lost, reconnecting")
+                    await asyncio.sleep(0.1 * 2**attempt)
+                    continue
+                except BaseException:
+                    if smtp is not None:
+                        smtp.close()
+                    raise
+                self._release(smtp)
+                return
+
+    async def close(self) -> None:
+        self._closed = True
+        while self._idle:
+            smtp, _ = self._idle.popleft()
+            try:
+                await smtp.quit()
+            except (aiosmtplib.SMTPException, OSError):
+                smtp.close()
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            smtp, released_at = self._idle.pop()
+            idle = monotonic() - released_at
+            if not smtp.is_connected or idle >= self.max_idle:
+                smtp.close()
+                continue
+            if idle >= self.noop_interval:
+                try:
+                    await smtp.noop()
+                except (aiosmtplib.SMTPException, OSError):
+                    smtp.close()
+                    continue
+            return smtp
+        return await self._connect()
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            timeout=self.timeout,
+        )
+        await smtp.connect()
+        return smtp
+
+    def _release(self, smtp: aiosmtplib.SMTP) -> None:
+        if self._closed:
+            smtp.close()
+            return
+        self._idle.append((smtp, monotonic()))
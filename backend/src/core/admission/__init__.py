@@ -0,0 +1,12 @@
+from core.admission.controller import AdmissionController, AdmissionRejected
+from core.admission.middleware import AdmissionMiddleware
+from core.admission.priority import Priority, RoutePriority, route_priority
+
+__all__ = [
+    "route_priority",
+    "AdmissionController",
+    "AdmissionMiddleware",
+    "AdmissionRejected",
+    "Priority",
+    "RoutePriority",
+]
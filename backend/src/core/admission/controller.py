@@ -0,0 +1,116 @@
+import asyncio
+import heapq
+import itertools
+
+from core.admission.priority import Priority
+from core.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUED,
+    ADMISSION_REJECTED_TOTAL,
+)
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_queue: int,
+        queue_timeout: float,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._in_flight = 0
+        # Heap of (priority, arrival, future): the highest priority and,
+        # within it, the oldest waiter gets the next free slot.
+        self._queue: list[tuple[Priority, int, asyncio.Future]] = []
+        self._arrivals = itertools.count()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    async def acquire(self, priority: Priority) -> None:
+        if self._in_flight < self.max_in_flight and not self._queue:
+            self._in_flight += 1
+            ADMISSION_IN_FLIGHT.set(self._in_flight)
+            return
+
+        if len(self._queue) >= self.max_queue:
+            self._shed(priority)
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._arrivals), future)
+        heapq.heappush(self._queue, entry)
+        ADMISSION_QUEUED.set(len(self._queue))
+
+        try:
+            await asyncio.wait((future,), timeout=self.queue_timeout)
+        except BaseException:
+            self._abandon(entry)
+            raise
+        if not future.done():
+            self._abandon(entry)
+            self._reject(priority, "timeout")
+        # Raises AdmissionRejected when a higher priority request took
+        # this waiter's place in the queue.
+        future.result()
+
+    def release(self) -> None:
+        # The slot is handed straight to the next waiter, so in_flight
+        # only drops once the queue is empty.
+        while self._queue:
+            _, _, future = heapq.heappop(self._queue)
+            if not future.done():
+                future.set_result(None)
+                ADMISSION_QUEUED.set(len(self._queue))
+                return
+        self._in_flight -= 1
+        ADMISSION_IN_FLIGHT.set(self._in_flight)
+        ADMISSION_QUEUED.set(0)
+
+    def _shed(self, priority: Priority) -> None:
+        # The queue is full: the newest waiter of the lowest priority
+        # makes room, unless the new request ranks no higher than it.
+        # With max_queue=0 nothing is ever queued to make room.
+        if not self._queue:
+            self._reject(priority, "queue_full")
+        victim = max(self._queue, key=lambda entry: entry[:2])
+        if victim[0] <= priority:
+            self._reject(priority, "queue_full")
+
+        self._queue.remove(victim)
+        heapq.heapify(self._queue)
+        ADMISSION_REJECTED_TOTAL.labels(victim[0].name.lower(), "shed").inc()
+        victim[2].set_exception(AdmissionRejected("shed"))
+
+    def _abandon(self, entry: tuple[Priority, int, asyncio.Future]) -> None:
+        future = entry[2]
+        if future.done():
+            # A slot was handed over just as the waiter gave up.
+            if not future.cancelled() and future.exception() is None:
+                self.release()
+            return
+
+        future.cancel()
+        self._queue.remove(entry)
+        heapq.heapify(self._queue)
+        ADMISSION_QUEUED.set(len(self._queue))
+
+    def _reject(self, priority: Priority, reason: str) -> None:
+        ADMISSION_REJECTED_TOTAL.labels(priority.name.lower(), reason).inc()
+        raise AdmissionRejected(reason)
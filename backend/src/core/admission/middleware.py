@@ -0,0 +1,62 @@
+from collections.abc import Iterable
+
+from fastapi import status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.admission.controller import AdmissionController, AdmissionRejected
+from core.admission.priority import Priority, RoutePriority
+from core.rate_limiter.route_policy import RoutePolicyTable
+
+
+class AdmissionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        priorities: Iterable[RoutePriority],
+        max_in_flight: int,
+        max_queue: int,
+        queue_timeout: float,
+        retry_after: int = 1,
+        default_priority: Priority = Priority.NORMAL,
+    ):
+        self.app = app
+        self._table = RoutePolicyTable(priorities)
+        self._default_priority = default_priority
+        self._retry_after = retry_after
+        # Middleware is built once per worker process, so the limits
+        # apply per worker.
+        self._controller = AdmissionController(
+            max_in_flight=max_in_flight,
+            max_queue=max_queue,
+            queue_timeout=queue_timeout,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = self._table.match(scope["method"], scope["path"])
+        priority = self._default_priority if route is None else route.priority
+        if priority is Priority.CRITICAL:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self._controller.acquire(priority)
+        except AdmissionRejected:
+            await self._service_unavailable()(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._controller.release()
+
+    def _service_unavailable(self) -> JSONResponse:
+        return JSONResponse(
+            {"detail": "Server is busy. Please try again later."},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(self._retry_after)},
+        )
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    # Not admission controlled: health checks and metrics scrapes must
+    # answer even while the worker is saturated.
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+
+@dataclass(frozen=True, slots=True)
+class RoutePriority:
+    method: str
+    path: str
+    priority: Priority
+
+
+def route_priority(
+    method: str,
+    path: str,
+    priority: Priority,
+) -> RoutePriority:
+    return RoutePriority(method=method.upper(), path=path, priority=priority)
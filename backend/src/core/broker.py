@@ -2,8 +2,10 @@ __all__ = ["broker"]
 
 from taskiq_aio_pika import AioPikaBroker
 
+from core.metrics import EnqueueMetricsMiddleware
 from entrypoint.config import config
 
 broker = AioPikaBroker(
     url=config.rabbitmq.URL,
-)
+    qos=config.worker.PREFETCH,
+).with_middlewares(EnqueueMetricsMiddleware())
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import math
+import random
+import secrets
+from collections.abc import Awaitable, Callable
+from time import perf_counter, time
+from typing import Any
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core.metrics import CACHE_REQUESTS_TOTAL, REDIS_SECONDS
+
+logger = logging.getLogger(__name__)
+
+_REDIS_ERRORS = (RedisError, OSError)
+
+# Entries live as fields of a hash so one DEL invalidates a whole group
+# (a message, or every cached page). Fill locks live in "<key>:locks" and
+# are dropped together with the entries, so a fill that raced a write
+# finds its lock gone and discards the value it loaded.
+_ACQUIRE = """
+local now = redis.call('TIME')
+local now_ms = now[1] * 1000 + math.floor(now[2] / 1000)
+local holder = redis.call('HGET', KEYS[1], ARGV[1])
+if holder and tonumber(string.match(holder, ':(%d+)$')) > now_ms then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2] .. ':' .. (now_ms + ARGV[3]))
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+_FILL = """
+local holder = redis.call('HGET', KEYS[2], ARGV[1])
+if not holder or string.match(holder, '^([^:]+):') ~= ARGV[2] then
+    return 0
+end
+redis.call('HDEL', KEYS[2], ARGV[1])
+if ARGV[3] == '' then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[3])
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+
+class _CacheUnavailable(Exception):
+    pass
+
+
+class RedisCache:
+    def __init__(
+        self,
+        redis: Redis,
+        name: str,
+        ttl: float,
+        lock_ttl: float,
+        wait_timeout: float,
+        beta: float = 1.0,
+    ):
+        self.redis = redis
+        self.name = name
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout
+        self.beta = beta
+        self._acquire = redis.register_script(_ACQUIRE)
+        self._fill = redis.register_script(_FILL)
+        self._redis_seconds = REDIS_SECONDS.labels(f"{name}.cache")
+        self._hits = CACHE_REQUESTS_TOTAL.labels(name, "hit")
+        self._misses = CACHE_REQUESTS_TOTAL.labels(name, "miss")
+        self._refreshes = CACHE_REQUESTS_TOTAL.labels(name, "early_refresh")
+        self._errors = CACHE_REQUESTS_TOTAL.labels(name, "error")
+
+    async def get_or_load(
+        self,
+        key: str,
+        field: str,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        # The cache is an optimisation: while Redis fails, reads go to
+        # the database and nothing is cached.
+        try:
+            return await self._get_or_load(key, field, load)
+        except _CacheUnavailable:
+            return await load()
+
+    async def _get_or_load(
+        self,
+        key: str,
+        field: str,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        entry = await self._get(key, field)
+        if entry is not None:
+            expires_at, delta, value = entry
+            if not self._refresh_early(expires_at, delta):
+                self._hits.inc()
+                return value
+            # Only the caller that wins the lock refreshes; everyone else
+            # keeps serving the current value.
+            token = await self._lock(key, field)
+            if token is None:
+                self._hits.inc()
+                return value
+            self._refreshes.inc()
+            return await self._load_and_fill(key, field, load, token)
+
+        self._misses.inc()
+        deadline = perf_counter() + self.wait_timeout
+        while True:
+            token = await self._lock(key, field)
+            if token is not None:
+                return await self._load_and_fill(key, field, load, token)
+            if perf_counter() >= deadline:
+                return await load()
+
+            await asyncio.sleep(0.01)
+            entry = await self._get(key, field)
+            if entry is not None:
+                return entry[2]
+
+    async def invalidate(self, *keys: str) -> None:
+        start = perf_counter()
+        try:
+            await self.redis.delete(*keys, *(f"{key}:locks" for key in keys))
+        finally:
+            self._redis_seconds.observe(perf_counter() - start)
+
+    def _refresh_early(self, expires_at: float, delta: float) -> bool:
+        # Probabilistic early expiration: the closer an entry is to its
+        # expiry and the slower it is to rebuild, the likelier a reader
+        # refreshes it ahead of time, so hot keys never expire for all
+        # readers at once.
+        jitter = -math.log(1.0 - random.random())
+        return time() + delta * self.beta * jitter >= expires_at
+
+    async def _get(self, key: str, field: str) -> list | None:
+        start = perf_counter()
+        try:
+            raw = await self.redis.hget(key, field)
+        except _REDIS_ERRORS as exc:
+            self._unavailable(exc)
+        finally:
+            self._redis_seconds.observe(perf_counter() - start)
+        return orjson.loads(raw) if raw is not None else None
+
+    async def _lock(self, key: str, field: str) -> str | None:
+        token = secrets.token_hex(8)
+        start = perf_counter()
+        try:
+            acquired = await self._acquire(
+                keys=[f"{key}:locks"],
+                args=[field, token, int(self.lock_ttl * 1000)],
+            )
+        except _REDIS_ERRORS as exc:
+            self._unavailable(exc)
+        finally:
+            self._redis_seconds.observe(perf_counter() - start)
+        return token if acquired else None
+
+    async def _load_and_fill(
+        self,
+        key: str,
+        field: str,
+        load: Callable[[], Awaitable[Any]],
+        token: str,
+    ) -> Any:
+        payload = b""
+        try:
+            start = time()
+            value = await load()
+            delta = time() - start
+            payload = orjson.dumps([start + delta + self.ttl, delta, value])
+            return value
+        finally:
+            try:
+                await self._fill(
+                    keys=[key, f"{key}:locks"],
+                    # Kept past its logical expiry so readers can serve
+                    # the old value while one of them refreshes it.
+                    args=[field, token, payload, int(self.ttl * 2000)],
+                )
+            except _REDIS_ERRORS as exc:
+                # The loaded value is still returned, just not cached.
+                self._errors.inc()
+                logger.warning("Filling %s cache failed: %r", self.name, exc)
+
+    def _unavailable(self, exc: Exception):
+        self._errors.inc()
+        logger.warning("%s cache unavailable: %r", self.name, exc)
+        raise _CacheUnavailable from exc
@@ -0,0 +1,85 @@
+from enum import IntEnum
+from time import monotonic
+
+from core.metrics import (
+    CIRCUIT_BREAKER_STATE,
+    CIRCUIT_BREAKER_TRANSITIONS_TOTAL,
+)
+
+
+class BreakerState(IntEnum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 5,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        CIRCUIT_BREAKER_STATE.labels(name).set(self._state)
+
+    @property
+    def state(self) -> BreakerState:
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        if self._state is not BreakerState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - monotonic())
+
+    def allow(self) -> bool:
+        if self._state is BreakerState.CLOSED:
+            return True
+        if self._state is BreakerState.OPEN:
+            if self.retry_after:
+                return False
+            self._transition(BreakerState.HALF_OPEN)
+        # Half open: a single call probes the backend, everyone else
+        # keeps taking the fallback until it reports back.
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record(self, succeeded: bool) -> None:
+        self._probing = False
+        if succeeded:
+            self._failures = 0
+            if self._state is not BreakerState.CLOSED:
+                self._transition(BreakerState.CLOSED)
+            return
+
+        self._failures += 1
+        if (
+            self._state is BreakerState.HALF_OPEN
+            or self._failures >= self.failure_threshold
+        ):
+            self._opened_at = monotonic()
+            self._transition(BreakerState.OPEN)
+
+    def release_probe(self) -> None:
+        # The call was abandoned before the backend answered, so it says
+        # nothing about its health; let the next caller probe instead.
+        self._probing = False
+
+    def _transition(self, state: BreakerState) -> None:
+        if state is self._state:
+            return
+        self._state = state
+        CIRCUIT_BREAKER_STATE.labels(self.name).set(state)
+        CIRCUIT_BREAKER_TRANSITIONS_TOTAL.labels(
+            self.name,
+            state.name.lower(),
+        ).inc()
@@ -0,0 +1,58 @@
+from time import perf_counter
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_WAIT_SECONDS,
+)
+from entrypoint.config import DatabaseConfig
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    # The gauges are updated here rather than from the checkout/checkin
+    # events: "checkin" fires before the connection is handed back, so
+    # it would still count the connection being returned.
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT_SECONDS.observe(perf_counter() - start)
+            self._update_gauges()
+
+    def _do_return_conn(self, record):
+        try:
+            super()._do_return_conn(record)
+        finally:
+            self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        DB_POOL_CHECKED_OUT.set(self.checkedout())
+        DB_POOL_OVERFLOW.set(self.overflow())
+
+
+def create_engine(config: DatabaseConfig) -> AsyncEngine:
+    url = make_url(config.get_db_url()).update_query_dict(
+        {"prepared_statement_cache_size": str(config.STATEMENT_CACHE_SIZE)},
+    )
+    engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=config.POOL_SIZE,
+        max_overflow=config.MAX_OVERFLOW,
+        pool_timeout=config.POOL_TIMEOUT,
+        pool_recycle=config.POOL_RECYCLE,
+        pool_pre_ping=config.POOL_PRE_PING,
+        connect_args={"statement_cache_size": config.STATEMENT_CACHE_SIZE},
+    )
+    _instrument_pool(engine)
+    return engine
+
+
+def _instrument_pool(engine: AsyncEngine) -> None:
+    DB_POOL_SIZE.set(engine.sync_engine.pool.size())
@@ -0,0 +1,15 @@
+from core.deadline.deadline import (
+    Deadline,
+    RouteDeadline,
+    current_deadline,
+    route_deadline,
+)
+from core.deadline.middleware import DeadlineMiddleware
+
+__all__ = [
+    "current_deadline",
+    "route_deadline",
+    "Deadline",
+    "DeadlineMiddleware",
+    "RouteDeadline",
+]
@@ -0,0 +1,46 @@
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+class Deadline:
+    def __init__(self, expires_at: float | None = None):
+        # In event loop time, which asyncio.timeout_at expects.
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float | None) -> "Deadline":
+        if seconds is None:
+            return cls()
+        return cls(asyncio.get_running_loop().time() + seconds)
+
+    def remaining(self) -> float | None:
+        if self.expires_at is None:
+            return None
+        return self.expires_at - asyncio.get_running_loop().time()
+
+    def timeout(self) -> asyncio.Timeout:
+        return asyncio.timeout_at(self.expires_at)
+
+
+# Set by DeadlineMiddleware for the task handling the request; work
+# started outside a request (console commands, workers) has no deadline.
+current_deadline: ContextVar[Deadline] = ContextVar(
+    "current_deadline",
+    default=Deadline(),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RouteDeadline:
+    method: str
+    path: str
+    timeout: float | None
+
+
+def route_deadline(
+    method: str,
+    path: str,
+    timeout: float | None,
+) -> RouteDeadline:
+    return RouteDeadline(method=method.upper(), path=path, timeout=timeout)
@@ -0,0 +1,62 @@
+from collections.abc import Iterable
+
+from fastapi import status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.deadline.deadline import Deadline, RouteDeadline, current_deadline
+from core.rate_limiter.route_policy import RoutePolicyTable
+
+
+class DeadlineMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        deadlines: Iterable[RouteDeadline],
+        default_timeout: float | None,
+    ):
+        self.app = app
+        self._table = RoutePolicyTable(deadlines)
+        self._default_timeout = default_timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = self._table.match(scope["method"], scope["path"])
+        timeout = self._default_timeout if route is None else route.timeout
+        if timeout is None:
+            await self.app(scope, receive, send)
+            return
+
+        deadline = Deadline.after(timeout)
+        token = current_deadline.set(deadline)
+        response_started = False
+
+        async def send_with_state(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        # Everything the request awaits, queries, Redis and broker calls
+        # included, is cancelled once the deadline passes, and the
+        # cleanup on the way out hands pooled connections back.
+        timeout_scope = deadline.timeout()
+        try:
+            async with timeout_scope:
+                await self.app(scope, receive, send_with_state)
+        except TimeoutError:
+            if response_started or not timeout_scope.expired():
+                raise
+            await _gateway_timeout()(scope, receive, send)
+        finally:
+            current_deadline.reset(token)
+
+
+def _gateway_timeout() -> JSONResponse:
+    return JSONResponse(
+        {"detail": "The request took too long to process."},
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+    )
@@ -0,0 +1,63 @@
+from core.metrics.instrumentation import instrument_repository
+from core.metrics.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUED,
+    ADMISSION_REJECTED_TOTAL,
+    CACHE_REQUESTS_TOTAL,
+    CIRCUIT_BREAKER_STATE,
+    CIRCUIT_BREAKER_TRANSITIONS_TOTAL,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_WAIT_SECONDS,
+    DB_QUERY_SECONDS,
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS_TOTAL,
+    OUTBOX_DEAD_LETTERED_TOTAL,
+    OUTBOX_PUBLISHED_TOTAL,
+    OUTBOX_PUBLISH_FAILURES_TOTAL,
+    PASSWORD_HASHER_PENDING,
+    PASSWORD_HASHER_REJECTED,
+    PASSWORD_HASHER_SECONDS,
+    RATE_LIMITER_FALLBACK_TOTAL,
+    REDIS_POOL_IDLE,
+    REDIS_POOL_IN_USE,
+    REDIS_POOL_SIZE,
+    REDIS_POOL_WAIT_SECONDS,
+    REDIS_SECONDS,
+    TASK_ENQUEUE_SECONDS,
+)
+from core.metrics.middleware import MetricsMiddleware
+from core.metrics.taskiq_middleware import EnqueueMetricsMiddleware
+
+__all__ = [
+    "instrument_repository",
+    "MetricsMiddleware",
+    "EnqueueMetricsMiddleware",
+    "ADMISSION_IN_FLIGHT",
+    "ADMISSION_QUEUED",
+    "ADMISSION_REJECTED_TOTAL",
+    "CACHE_REQUESTS_TOTAL",
+    "CIRCUIT_BREAKER_STATE",
+    "CIRCUIT_BREAKER_TRANSITIONS_TOTAL",
+    "DB_POOL_CHECKED_OUT",
+    "DB_POOL_OVERFLOW",
+    "DB_POOL_SIZE",
+    "DB_POOL_WAIT_SECONDS",
+    "DB_QUERY_SECONDS",
+    "HTTP_REQUEST_SECONDS",
+    "HTTP_REQUESTS_TOTAL",
+    "OUTBOX_DEAD_LETTERED_TOTAL",
+    "OUTBOX_PUBLISHED_TOTAL",
+    "OUTBOX_PUBLISH_FAILURES_TOTAL",
+    "PASSWORD_HASHER_PENDING",
+    "PASSWORD_HASHER_REJECTED",
+    "PASSWORD_HASHER_SECONDS",
+    "RATE_LIMITER_FALLBACK_TOTAL",
+    "REDIS_POOL_IDLE",
+    "REDIS_POOL_IN_USE",
+    "REDIS_POOL_SIZE",
+    "REDIS_POOL_WAIT_SECONDS",
+    "REDIS_SECONDS",
+    "TASK_ENQUEUE_SECONDS",
+]
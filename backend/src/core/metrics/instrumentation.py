@@ -0,0 +1,27 @@
+import inspect
+from functools import wraps
+from time import perf_counter
+
+from core.metrics.metrics import DB_QUERY_SECONDS
+
+
+def instrument_repository(cls):
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(attr):
+            continue
+        setattr(cls, name, _timed(attr, f"{cls.__name__}.{name}"))
+    return cls
+
+
+def _timed(func, operation: str):
+    histogram = DB_QUERY_SECONDS.labels(operation)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            histogram.observe(perf_counter() - start)
+
+    return wrapper
@@ -0,0 +1,142 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+PASSWORD_HASHER_SECONDS = Histogram(
+    "password_hasher_seconds",
+    "Time spent hashing or verifying a password, including queueing.",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5, 5.0),
+)
+PASSWORD_HASHER_REJECTED = Counter(
+    "password_hasher_rejected_total",
+    "Password hashing calls rejected because the worker pool was saturated.",
+    ["operation"],
+)
+PASSWORD_HASHER_PENDING = Gauge(
+    "password_hasher_pending",
+    "Password hashing calls running or waiting in the worker pool.",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the SQLAlchemy pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections opened beyond pool_size (negative while the pool fills).",
+    multiprocess_mode="livesum",
+)
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured pool_size of the SQLAlchemy pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT_SECONDS = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent acquiring a connection from the SQLAlchemy pool.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight",
+    "Admission-controlled requests currently being handled.",
+    multiprocess_mode="livesum",
+)
+ADMISSION_QUEUED = Gauge(
+    "admission_queued",
+    "Requests waiting for an admission slot.",
+    multiprocess_mode="livesum",
+)
+ADMISSION_REJECTED_TOTAL = Counter(
+    "admission_rejected_total",
+    "Requests answered with 503 by admission control, by priority and reason.",
+    ["priority", "reason"],
+)
+
+REDIS_POOL_IN_USE = Gauge(
+    "redis_pool_in_use",
+    "Connections currently checked out of the Redis pool.",
+    multiprocess_mode="livesum",
+)
+REDIS_POOL_IDLE = Gauge(
+    "redis_pool_idle",
+    "Open connections waiting in the Redis pool.",
+    multiprocess_mode="livesum",
+)
+REDIS_POOL_SIZE = Gauge(
+    "redis_pool_size",
+    "Configured max_connections of the Redis pool.",
+    multiprocess_mode="livesum",
+)
+REDIS_POOL_WAIT_SECONDS = Histogram(
+    "redis_pool_wait_seconds",
+    "Time spent acquiring a connection from the Redis pool.",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0),
+)
+
+HTTP_REQUESTS_TOTAL = Counter(
+    "http_requests_total",
+    "HTTP requests handled, by route template and status code.",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_seconds",
+    "HTTP request latency, by route template.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_seconds",
+    "Time spent in repository methods, including connection checkout.",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0),
+)
+REDIS_SECONDS = Histogram(
+    "redis_seconds",
+    "Time spent waiting on Redis, by operation.",
+    ["operation"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.1),
+)
+CIRCUIT_BREAKER_STATE = Gauge(
+    "circuit_breaker_state",
+    "Circuit breaker state: 0 closed, 1 half open, 2 open.",
+    ["breaker"],
+    multiprocess_mode="livemax",
+)
+CIRCUIT_BREAKER_TRANSITIONS_TOTAL = Counter(
+    "circuit_breaker_transitions_total",
+    "Circuit breaker state changes, by breaker and new state.",
+    ["breaker", "state"],
+)
+RATE_LIMITER_FALLBACK_TOTAL = Counter(
+    "rate_limiter_fallback_total",
+    "Rate limit checks decided without Redis, by outcome.",
+    ["outcome"],
+)
+CACHE_REQUESTS_TOTAL = Counter(
+    "cache_requests_total",
+    "Redis read-through cache lookups, by cache and result.",
+    ["cache", "result"],
+)
+TASK_ENQUEUE_SECONDS = Histogram(
+    "task_enqueue_seconds",
+    "Time spent publishing a taskiq task to the broker.",
+    ["task"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0),
+)
+OUTBOX_PUBLISHED_TOTAL = Counter(
+    "outbox_published_total",
+    "Outbox rows published to the broker and removed from the table.",
+    ["task"],
+)
+OUTBOX_PUBLISH_FAILURES_TOTAL = Counter(
+    "outbox_publish_failures_total",
+    "Failed attempts to publish an outbox row to the broker.",
+    ["task"],
+)
+OUTBOX_DEAD_LETTERED_TOTAL = Counter(
+    "outbox_dead_lettered_total",
+    "Outbox rows given up on after OUTBOX_MAX_ATTEMPTS failed publishes.",
+    ["task"],
+)
@@ -0,0 +1,57 @@
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.metrics.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_TOTAL
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # labels() takes a lock and hashes the label tuple; caching the
+        # children keeps the per-request cost to two dict lookups.
+        self._latency = {}
+        self._requests = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - start
+            route = scope.get("route")
+            route_name = route.path_format if route else UNMATCHED_ROUTE
+            self._observe(scope["method"], route_name, status_code, elapsed)
+
+    def _observe(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        elapsed: float,
+    ) -> None:
+        latency = self._latency.get((method, route))
+        if latency is None:
+            latency = HTTP_REQUEST_SECONDS.labels(method, route)
+            self._latency[(method, route)] = latency
+        latency.observe(elapsed)
+
+        requests = self._requests.get((method, route, status_code))
+        if requests is None:
+            requests = HTTP_REQUESTS_TOTAL.labels(method, route, status_code)
+            self._requests[(method, route, status_code)] = requests
+        requests.inc()
@@ -0,0 +1,29 @@
+from contextvars import ContextVar
+from time import perf_counter
+
+from taskiq import TaskiqMessage, TaskiqMiddleware
+
+from core.metrics.metrics import TASK_ENQUEUE_SECONDS
+
+# kiq() runs pre_send, the broker send and post_send in the caller's
+# task, so the start time can live in its context. A send that raises
+# or is cancelled leaves nothing behind in the process.
+_send_started: ContextVar[tuple[str, float] | None] = ContextVar(
+    "task_send_started",
+    default=None,
+)
+
+
+class EnqueueMetricsMiddleware(TaskiqMiddleware):
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        _send_started.set((message.task_id, perf_counter()))
+        return message
+
+    def post_send(self, message: TaskiqMessage) -> None:
+        started = _send_started.get()
+        if started is None or started[0] != message.task_id:
+            return
+        _send_started.set(None)
+        TASK_ENQUEUE_SECONDS.labels(message.task_name).observe(
+            perf_counter() - started[1],
+        )
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from taskiq import AsyncBroker, AsyncTaskiqDecoratedTask
+from taskiq.kicker import AsyncKicker
+
+from core.metrics import (
+    OUTBOX_DEAD_LETTERED_TOTAL,
+    OUTBOX_PUBLISH_FAILURES_TOTAL,
+    OUTBOX_PUBLISHED_TOTAL,
+)
+from core.uow import UnitOfWork
+from models import OutboxMessage
+from repositories.outbox import OutboxRepository, OutboxRepositoryI
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxPublisher:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        broker: AsyncBroker,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: int = 10,
+        retry_base: float = 1.0,
+        retry_max: float = 300.0,
+    ):
+        self.session_factory = session_factory
+        self.broker = broker
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    async def publish_batch(self) -> int:
+        async with self.session_factory() as session, session.begin():
+            repository = OutboxRepository(session)
+            messages = await repository.claim_batch(self.batch_size)
+            if not messages:
+                return 0
+
+            # The broker channel uses publisher confirms, so each kiq
+            # returns once RabbitMQ has the message. Publishing the batch
+            # concurrently waits for all confirms at once.
+            results = await asyncio.gather(
+                *(
+                    AsyncKicker(message.task_name, self.broker, labels={})
+                    .with_task_id(f"outbox-{message.id}")
+                    .kiq(**message.kwargs)
+                    for message in messages
+                ),
+                return_exceptions=True,
+            )
+
+            published = []
+            for message, result in zip(messages, results):
+                if isinstance(result, Exception):
+                    await self._record_failure(repository, message, result)
+                    continue
+                OUTBOX_PUBLISHED_TOTAL.labels(message.task_name).inc()
+                published.append(message.id)
+
+            if published:
+                await repository.delete(published)
+        return len(published)
+
+    def retry_delay(self, attempts: int) -> float | None:
+        # Exponential backoff after the given number of failed attempts;
+        # None once the message has used them all up.
+        if attempts >= self.max_attempts:
+            return None
+        return min(self.retry_base * 2 ** (attempts - 1), self.retry_max)
+
+    async def _record_failure(
+        self,
+        repository: OutboxRepositoryI,
+        message: OutboxMessage,
+        exc: Exception,
+    ) -> None:
+        OUTBOX_PUBLISH_FAILURES_TOTAL.labels(message.task_name).inc()
+        retry_in = self.retry_delay(message.attempts + 1)
+        await repository.record_failure(message, retry_in)
+        if retry_in is None:
+            OUTBOX_DEAD_LETTERED_TOTAL.labels(message.task_name).inc()
+            logger.error(
+                "Outbox message %s failed %d times, giving up: %r",
+                message.id,
+                message.attempts,
+                exc,
+            )
+            return
+        logger.warning(
+            "Publishing outbox message %s failed, retrying in %.0fs: %r",
+            message.id,
+            retry_in,
+            exc,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                published = await self.publish_batch()
+            except Exception:
+                logger.exception("Outbox publisher failed")
+                published = 0
+
+            if published < self.batch_size:
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(),
+                        self.poll_interval,
+                    )
+                except TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+
+class Outbox:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        repository: OutboxRepositoryI,
+        publisher: OutboxPublisher,
+    ):
+        self.uow = uow
+        self.repository = repository
+        self.publisher = publisher
+
+    async def enqueue(
+        self,
+        task: AsyncTaskiqDecoratedTask,
+        **kwargs: Any,
+    ) -> None:
+        # Written in the caller's transaction, so the task is published
+        # only if that transaction commits.
+        await self.repository.add(task.task_name, kwargs)
+        self.uow.on_commit(self._wake_publisher)
+
+    async def _wake_publisher(self) -> None:
+        self.publisher.wake()
@@ -0,0 +1,118 @@
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from time import perf_counter
+
+import bcrypt
+from fastapi import HTTPException, status
+
+from core.metrics import (
+    PASSWORD_HASHER_PENDING,
+    PASSWORD_HASHER_REJECTED,
+    PASSWORD_HASHER_SECONDS,
+)
+from entrypoint.config import Config
+
+
+class PasswordHasherBusyError(HTTPException):
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy. Please try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+def _hash_password(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def _check_password(password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed_password)
+
+
+class PasswordHasher:
+    def __init__(
+        self,
+        executor: Executor,
+        max_pending: int,
+        rounds: int = 12,
+        retry_after: int = 1,
+    ):
+        self._executor = executor
+        self._max_pending = max_pending
+        self._rounds = rounds
+        self._retry_after = retry_after
+        self._pending = 0
+
+    @classmethod
+    def from_config(cls, config: Config) -> "PasswordHasher":
+        hasher_config = config.password_hasher
+        if hasher_config.EXECUTOR == "process":
+            executor = ProcessPoolExecutor(max_workers=hasher_config.WORKERS)
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=hasher_config.WORKERS,
+                thread_name_prefix="password-hasher",
+            )
+        return cls(
+            executor=executor,
+            max_pending=hasher_config.WORKERS + hasher_config.MAX_QUEUE,
+            rounds=hasher_config.ROUNDS,
+            retry_after=hasher_config.RETRY_AFTER,
+        )
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        hashed = await self._run(
+            "hash",
+            _hash_password,
+            password.encode(),
+            self._rounds,
+        )
+        return hashed.decode("utf-8")
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(
+            "verify",
+            _check_password,
+            password.encode(),
+            hashed_password.encode("utf-8"),
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, operation: str, func, *args):
+        if self._pending >= self._max_pending:
+            PASSWORD_HASHER_REJECTED.labels(operation).inc()
+            raise PasswordHasherBusyError(self._retry_after)
+
+        start = perf_counter()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, func, *args)
+
+        self._pending += 1
+        PASSWORD_HASHER_PENDING.inc()
+        # The slot is held until the pool finishes the job, even if the
+        # awaiting request is cancelled, so the queue limit stays honest.
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.shield(future)
+        finally:
+            PASSWORD_HASHER_SECONDS.labels(operation).observe(
+                perf_counter() - start,
+            )
+
+    def _release(self, future: asyncio.Future) -> None:
+        self._pending -= 1
+        PASSWORD_HASHER_PENDING.dec()
+        if not future.cancelled():
+            future.exception()
@@ -1,3 +1,4 @@
+import inspect
 from functools import wraps
 
 from fastapi import HTTPException, status
@@ -7,18 +8,24 @@ from models import RoleEnum
 
 def require_roles(allowed_roles: list[RoleEnum]):
     def decorator(func):
+        signature = inspect.signature(func)
+        user_param = (
+            "user" if "user" in signature.parameters else "current_user"
+        )
+
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            user = kwargs.get("user")
-            if user is None:
+        async def wrapper(*args, **kwargs):
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+            if user_param not in arguments:
                 raise KeyError("User not found in kwags.")
 
+            user = arguments[user_param]
             if not user or user.role not in allowed_roles:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="You do not have the necessary permissions.",
                 )
-            return func
+            return await func(*args, **kwargs)
 
         return wrapper
 
@@ -1,9 +1,20 @@
-from core.rate_limiter.rate_limiter import RateLimiter
-from core.rate_limiter.rate_limiter_factory import rate_limit
+from core.rate_limiter.algorithm import Algorithm
+from core.rate_limiter.middleware import RateLimitMiddleware
+from core.rate_limiter.rate_limiter import (
+    RateLimiter,
+    RateLimiterUnavailable,
+    RateLimitResult,
+)
+from core.rate_limiter.route_policy import RoutePolicy, route_policy
 from core.rate_limiter.strategy import Strategy
 
 __all__ = [
-    "rate_limit",
+    "route_policy",
+    "Algorithm",
     "RateLimiter",
+    "RateLimiterUnavailable",
+    "RateLimitMiddleware",
+    "RateLimitResult",
+    "RoutePolicy",
     "Strategy",
 ]
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class Algorithm(Enum):
+    SLIDING_LOG = "sliding_log"
+    SLIDING_COUNTER = "sliding_counter"
@@ -0,0 +1,57 @@
+from fastapi import HTTPException, status
+from jwt import InvalidTokenError
+from starlette.requests import cookie_parser
+from starlette.types import Scope
+
+from core.rate_limiter.strategy import Strategy
+from utils.jwt_utils import decode_jwt
+
+
+def _header(scope: Scope, name: bytes) -> str | None:
+    # Runs on every limited request; a linear scan of the raw headers is
+    # cheaper than building a Request and its Headers mapping.
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def identify_by_ip(scope: Scope) -> str:
+    forwarded = _header(scope, b"x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def identify_by_user(scope: Scope) -> str:
+    # Runs before dishka resolves the current user, so the id comes from
+    # the verified access token itself; nothing the client sends unsigned
+    # can pick the bucket.
+    token = None
+    authorization = _header(scope, b"authorization")
+    if authorization:
+        scheme, _, credentials = authorization.partition(" ")
+        if scheme.lower() == "bearer":
+            token = credentials.strip()
+    else:
+        cookie = _header(scope, b"cookie")
+        if cookie:
+            token = cookie_parser(cookie).get("access_token")
+
+    try:
+        subject = decode_jwt(token).get("sub") if token else None
+    except InvalidTokenError:
+        subject = None
+    if not subject:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not authenticated for USER rate-limiting strategy.",
+        )
+    return str(subject)
+
+
+IDENTIFIERS = {
+    Strategy.IP: identify_by_ip,
+    Strategy.USER: identify_by_user,
+}
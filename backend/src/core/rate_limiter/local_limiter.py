@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+
+from core.rate_limiter.policy import Windows
+
+
+@dataclass(slots=True)
+class _BucketState:
+    tokens: list[float]
+    updated_at: float
+    blocked_until: float = 0.0
+
+
+class LocalRateLimiter:
+    def __init__(
+        self,
+        windows: Windows,
+        fraction: float = 1.0,
+        max_identifiers: int = 10_000,
+    ):
+        if not 0 < fraction <= 1:
+            raise ValueError(
+                f"Invalid local rate limit fraction: {fraction}.",
+                "Expected a value in (0, 1]",
+            )
+
+        self._buckets = tuple(
+            (capacity, capacity / window_seconds)
+            for capacity, window_seconds in (
+                (max(1.0, max_requests * fraction), window_seconds)
+                for max_requests, window_seconds in windows
+            )
+        )
+        self._max_identifiers = max_identifiers
+        self._states: OrderedDict[str, _BucketState] = OrderedDict()
+
+    def acquire(self, identifier: str) -> float:
+        now = monotonic()
+        state = self._get_state(identifier, now)
+
+        if state.blocked_until > now:
+            return state.blocked_until - now
+
+        elapsed = now - state.updated_at
+        state.updated_at = now
+
+        retry_after = 0.0
+        for i, (capacity, refill_rate) in enumerate(self._buckets):
+            tokens = min(capacity, state.tokens[i] + elapsed * refill_rate)
+            state.tokens[i] = tokens
+            if tokens < 1:
+                retry_after = max(retry_after, (1 - tokens) / refill_rate)
+
+        if retry_after:
+            return retry_after
+
+        for i in range(len(self._buckets)):
+            state.tokens[i] -= 1
+        return 0.0
+
+    def block(self, identifier: str, retry_after: float) -> None:
+        now = monotonic()
+        state = self._get_state(identifier, now)
+        state.blocked_until = max(state.blocked_until, now + retry_after)
+
+    def _get_state(self, identifier: str, now: float) -> _BucketState:
+        state = self._states.get(identifier)
+        if state is not None:
+            self._states.move_to_end(identifier)
+            return state
+
+        state = _BucketState(
+            tokens=[capacity for capacity, _ in self._buckets],
+            updated_at=now,
+        )
+        self._states[identifier] = state
+        if len(self._states) > self._max_identifiers:
+            self._states.popitem(last=False)
+        return state
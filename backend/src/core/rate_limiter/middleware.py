@@ -0,0 +1,157 @@
+import math
+from collections.abc import Iterable
+
+from fastapi import HTTPException, status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.rate_limiter.identifiers import IDENTIFIERS
+from core.metrics import RATE_LIMITER_FALLBACK_TOTAL
+from core.rate_limiter.rate_limiter import (
+    RateLimiter,
+    RateLimiterUnavailable,
+    RateLimitResult,
+)
+from core.rate_limiter.route_policy import RoutePolicy, RoutePolicyTable
+
+_LIMIT_HEADER = b"x-ratelimit-limit"
+_REMAINING_HEADER = b"x-ratelimit-remaining"
+_RESET_HEADER = b"x-ratelimit-reset"
+
+
+class RateLimitMiddleware:
+    def __init__(self, app: ASGIApp, policies: Iterable[RoutePolicy]):
+        self.app = app
+        self._table = RoutePolicyTable(policies)
+        self._rate_limiter: RateLimiter | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = self._table.match(scope["method"], scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            identifier = IDENTIFIERS[policy.strategy](scope)
+        except HTTPException as exc:
+            response = JSONResponse(
+                {"detail": exc.detail},
+                status_code=exc.status_code,
+                headers=exc.headers,
+            )
+            await response(scope, receive, send)
+            return
+
+        local_limiter = policy.local_limiter
+        if local_limiter is not None:
+            retry_after = local_limiter.acquire(identifier)
+            if retry_after:
+                await _too_many_requests(retry_after)(scope, receive, send)
+                return
+
+        rate_limiter = await self._get_rate_limiter(scope)
+        try:
+            result = await rate_limiter.check(
+                identifier,
+                scope["path"],
+                policy.windows,
+            )
+        except RateLimiterUnavailable as exc:
+            response = _fallback(policy, identifier, exc.retry_after)
+            if response is not None:
+                await response(scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
+            return
+
+        if result.limited:
+            if local_limiter is not None:
+                local_limiter.block(identifier, result.retry_after)
+            response = _too_many_requests(result.retry_after, result)
+            await response(scope, receive, send)
+            return
+
+        raw_headers = _raw_rate_limit_headers(result)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Handlers never set these, so appending is enough and
+                # skips the lookups MutableHeaders.update does per header.
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    *raw_headers,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    async def _get_rate_limiter(self, scope: Scope) -> RateLimiter:
+        if self._rate_limiter is None:
+            container = scope["app"].state.dishka_container
+            self._rate_limiter = await container.get(RateLimiter)
+        return self._rate_limiter
+
+
+def _fallback(
+    policy: RoutePolicy,
+    identifier: str,
+    retry_after: float,
+) -> JSONResponse | None:
+    if not policy.fail_open:
+        RATE_LIMITER_FALLBACK_TOTAL.labels("rejected").inc()
+        return JSONResponse(
+            {"detail": "Service temporarily unavailable."},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+    # A route with a local limiter already passed it above.
+    if policy.fallback_limiter is not None:
+        local_retry_after = policy.fallback_limiter.acquire(identifier)
+        if local_retry_after:
+            RATE_LIMITER_FALLBACK_TOTAL.labels("limited").inc()
+            return _too_many_requests(local_retry_after)
+    RATE_LIMITER_FALLBACK_TOTAL.labels("allowed").inc()
+    return None
+
+
+def _rate_limit_headers(result: RateLimitResult) -> dict[str, str]:
+    reset = result.retry_after if result.limited else result.window
+    return {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+        "X-RateLimit-Reset": str(math.ceil(reset)),
+    }
+
+
+def _raw_rate_limit_headers(
+    result: RateLimitResult,
+) -> list[tuple[bytes, bytes]]:
+    reset = result.retry_after if result.limited else result.window
+    return [
+        (_LIMIT_HEADER, b"%d" % result.limit),
+        (_REMAINING_HEADER, b"%d" % result.remaining),
+        (_RESET_HEADER, b"%d" % math.ceil(reset)),
+    ]
+
+
+def _too_many_requests(
+    retry_after: float,
+    result: RateLimitResult | None = None,
+) -> JSONResponse:
+    headers = {"Retry-After": str(math.ceil(retry_after))}
+    if result is not None:
+        headers.update(_rate_limit_headers(result))
+    else:
+        headers["X-RateLimit-Remaining"] = "0"
+        headers["X-RateLimit-Reset"] = headers["Retry-After"]
+
+    return JSONResponse(
+        {"detail": "Too many requests. Please try again later."},
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers=headers,
+    )
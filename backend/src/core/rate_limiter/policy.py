@@ -0,0 +1,29 @@
+import re
+
+_POLICY_PATTERN = re.compile(r"^(\d+\/[smhd])(;\d+\/[smhd]){0,2}$")
+_SEGMENT_PATTERN = re.compile(r"^(\d+)\/([smhd])$")
+_UNIT_SECONDS = {
+    "s": 1,
+    "m": 60,
+    "h": 60 * 60,
+    "d": 24 * 60 * 60,
+}
+
+Windows = tuple[tuple[int, int], ...]
+
+
+def compile_policy(policy: str | None) -> Windows:
+    if not policy or not _POLICY_PATTERN.match(policy):
+        raise ValueError(
+            f"Invalid request policy: {policy}.",
+            "Expected format: '5/s', '10/m', '20/h', '30/d'",
+        )
+
+    windows = []
+    for segment in policy.split(";"):
+        m = _SEGMENT_PATTERN.match(segment)
+        max_requests = int(m.group(1))
+        window_seconds = _UNIT_SECONDS[m.group(2)]
+        windows.append((max_requests, window_seconds))
+
+    return tuple(windows)
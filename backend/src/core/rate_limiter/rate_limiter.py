@@ -1,46 +1,108 @@
+import asyncio
 import random
-from time import time
+from dataclasses import dataclass
+from time import perf_counter
 
 from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core.circuit_breaker import CircuitBreaker
+from core.metrics import REDIS_SECONDS
+from core.rate_limiter import scripts
+from core.rate_limiter.algorithm import Algorithm
+from core.rate_limiter.policy import Windows
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    limited: bool
+    limit: int
+    remaining: int
+    retry_after: float  # seconds
+    window: int  # seconds
+
+
+class RateLimiterUnavailable(Exception):
+    def __init__(self, retry_after: float):
+        super().__init__("Rate limiter backend is unavailable")
+        self.retry_after = retry_after
+
+
+_CHECK_SECONDS = REDIS_SECONDS.labels("RateLimiter.check")
 
 
 class RateLimiter:
-    def __init__(self, redis: Redis):
+    _scripts = {
+        Algorithm.SLIDING_LOG: scripts.SLIDING_LOG,
+        Algorithm.SLIDING_COUNTER: scripts.SLIDING_COUNTER,
+    }
+
+    def __init__(
+        self,
+        redis: Redis,
+        algorithm: Algorithm = Algorithm.SLIDING_LOG,
+        timeout: float = 0.05,
+        breaker: CircuitBreaker | None = None,
+    ):
         self._redis = redis
+        self._timeout = timeout
+        self._breaker = breaker or CircuitBreaker("rate_limiter")
+        self._algorithm = algorithm
+        self._key_prefix = f"rate_limiter:{algorithm.value}"
+        # redis-py caches the SHA and falls back to SCRIPT LOAD on NOSCRIPT.
+        self._script = redis.register_script(self._scripts[algorithm])
 
-    async def is_limited(
+    async def check(
         self,
         identifier: str,
         endpoint: str,
-        windows: list[tuple[int, int]],
-    ) -> bool:
-        key = f"rate_limiter:{endpoint}:{identifier}"
-
-        current_ms = time() * 1000
-        current_request = f"{current_ms}--{random.randint(0, 100_000)}"
+        windows: Windows,
+    ) -> RateLimitResult:
+        key = f"{self._key_prefix}:{endpoint}:{identifier}"
 
-        max_window_seconds = max(ws for (_, ws) in windows)
-        oldest_window_start_ms = current_ms - max_window_seconds * 1000
+        args = []
+        if self._algorithm == Algorithm.SLIDING_LOG:
+            args.append(random.randint(0, 1_000_000))
+        for max_requests, window_seconds in windows:
+            args.append(max_requests)
+            args.append(window_seconds * 1000)
 
-        async with self._redis.pipeline() as pipe:
-            await pipe.zremrangebyscore(
-                name=key,
-                min=0,
-                max=oldest_window_start_ms,
-            )
+        # While Redis keeps failing the breaker is open and callers go
+        # straight to their fallback instead of waiting out the timeout.
+        if not self._breaker.allow():
+            raise RateLimiterUnavailable(self._breaker.retry_after)
 
-            for _, ws in windows:
-                window_start_ms = current_ms - ws * 1000
-                await pipe.zcount(key, window_start_ms, "+inf")
+        start = perf_counter()
+        try:
+            async with asyncio.timeout(self._timeout):
+                result = await self._script(keys=[key], args=args)
+        except (RedisError, OSError, TimeoutError) as exc:
+            self._breaker.record(succeeded=False)
+            raise RateLimiterUnavailable(self._breaker.retry_after) from exc
+        except BaseException:
+            # Cancelled by the client or a deadline, not a Redis failure.
+            self._breaker.release_probe()
+            raise
+        finally:
+            _CHECK_SECONDS.observe(perf_counter() - start)
+        self._breaker.record(succeeded=True)
 
-            await pipe.zadd(key, {current_request: current_ms})
-            await pipe.expire(key, max_window_seconds)
+        limited, remaining, retry_after_ms, index = result
 
-            res = await pipe.execute()
+        limit, window = windows[index - 1]
+        return RateLimitResult(
+            limited=bool(limited),
+            limit=limit,
+            remaining=remaining,
+            retry_after=retry_after_ms / 1000,
+            window=window,
+        )
 
-        counts = res[1 : 1 + len(windows)]
-        for (max_requests, _), count in zip(windows, counts, strict=False):
-            if count >= max_requests:
-                return True
-
-        return False
+    async def is_limited(
+        self,
+        identifier: str,
+        endpoint: str,
+        windows: Windows,
+    ) -> bool:
+        result = await self.check(identifier, endpoint, windows)
+        return result.limited
@@ -0,0 +1,77 @@
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from core.rate_limiter.local_limiter import LocalRateLimiter
+from core.rate_limiter.policy import Windows, compile_policy
+from core.rate_limiter.strategy import Strategy
+
+_PATH_PARAM_PATTERN = re.compile(r"\{[^/]+\}")
+
+
+@dataclass(frozen=True, slots=True)
+class RoutePolicy:
+    method: str
+    path: str
+    strategy: Strategy
+    windows: Windows
+    local_limiter: LocalRateLimiter | None = None
+    # What happens while Redis is unavailable: fail open keeps limiting
+    # per worker with fallback_limiter, fail closed rejects with 503.
+    fail_open: bool = True
+    fallback_limiter: LocalRateLimiter | None = None
+
+
+def route_policy(
+    method: str,
+    path: str,
+    policy: str,
+    strategy: Strategy = Strategy.IP,
+    local_fraction: float | None = None,
+    fail_open: bool = True,
+) -> RoutePolicy:
+    windows = compile_policy(policy)
+    local_limiter = None
+    if local_fraction is not None:
+        local_limiter = LocalRateLimiter(windows, local_fraction)
+    fallback_limiter = None
+    if fail_open and local_limiter is None:
+        fallback_limiter = LocalRateLimiter(windows)
+
+    return RoutePolicy(
+        method=method.upper(),
+        path=path,
+        strategy=strategy,
+        windows=windows,
+        local_limiter=local_limiter,
+        fail_open=fail_open,
+        fallback_limiter=fallback_limiter,
+    )
+
+
+class RoutePolicyTable:
+    def __init__(self, policies: Iterable[RoutePolicy]):
+        self._exact: dict[tuple[str, str], RoutePolicy] = {}
+        self._templated: list[tuple[str, re.Pattern, RoutePolicy]] = []
+
+        for policy in policies:
+            if _PATH_PARAM_PATTERN.search(policy.path):
+                pattern = "[^/]+".join(
+                    re.escape(part)
+                    for part in _PATH_PARAM_PATTERN.split(policy.path)
+                )
+                self._templated.append(
+                    (policy.method, re.compile(f"^{pattern}$"), policy)
+                )
+            else:
+                self._exact[(policy.method, policy.path)] = policy
+
+    def match(self, method: str, path: str) -> RoutePolicy | None:
+        policy = self._exact.get((method, path))
+        if policy is not None or not self._templated:
+            return policy
+
+        for policy_method, pattern, policy in self._templated:
+            if policy_method == method and pattern.match(path):
+                return policy
+        return None
@@ -0,0 +1,128 @@
+# Both scripts take the policy as flat (limit, window_ms) pairs in ARGV and
+# return {limited, remaining, retry_after_ms, window_index}, where
+# window_index is the 1-based position of the window that decided the
+# outcome. The request is only recorded when no window is exhausted.
+
+SLIDING_LOG = """
+local key = KEYS[1]
+local member = ARGV[1]
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local max_window = 0
+for i = 2, #ARGV, 2 do
+    max_window = math.max(max_window, tonumber(ARGV[i + 1]))
+end
+redis.call('ZREMRANGEBYSCORE', key, 0, now - max_window)
+
+local limited = 0
+local remaining = -1
+local retry_after = 0
+local decisive = 1
+for i = 2, #ARGV, 2 do
+    local limit = tonumber(ARGV[i])
+    local window = tonumber(ARGV[i + 1])
+    local window_start = '(' .. (now - window)
+    local count = redis.call('ZCOUNT', key, window_start, '+inf')
+    if count >= limit then
+        local oldest = redis.call(
+            'ZRANGEBYSCORE', key, window_start, '+inf',
+            'WITHSCORES', 'LIMIT', count - limit, 1
+        )
+        local wait = tonumber(oldest[2]) + window - now
+        if limited == 0 or wait > retry_after then
+            retry_after = wait
+            decisive = i / 2
+        end
+        limited = 1
+    elseif limited == 0 then
+        local left = limit - count - 1
+        if remaining < 0 or left < remaining then
+            remaining = left
+            decisive = i / 2
+        end
+    end
+end
+
+if limited == 1 then
+    return {1, 0, retry_after, decisive}
+end
+
+redis.call('ZADD', key, now, now .. '-' .. member)
+redis.call('PEXPIRE', key, max_window)
+return {0, remaining, 0, decisive}
+"""
+
+SLIDING_COUNTER = """
+local key = KEYS[1]
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local max_window = 0
+local limited = 0
+local remaining = -1
+local retry_after = 0
+local decisive = 1
+local updates = {}
+
+for i = 1, #ARGV, 2 do
+    local limit = tonumber(ARGV[i])
+    local window = tonumber(ARGV[i + 1])
+    max_window = math.max(max_window, window)
+
+    local bucket = math.floor(now / window)
+    local state = redis.call(
+        'HMGET', key, 'b' .. window, 'c' .. window, 'p' .. window
+    )
+    local stored = tonumber(state[1]) or -2
+    local current = 0
+    local previous = 0
+    if stored == bucket then
+        current = tonumber(state[2]) or 0
+        previous = tonumber(state[3]) or 0
+    elseif stored == bucket - 1 then
+        previous = tonumber(state[2]) or 0
+    end
+
+    local bucket_start = bucket * window
+    local elapsed = (now - bucket_start) / window
+    local estimate = previous * (1 - elapsed) + current
+
+    if estimate >= limit then
+        local wait
+        if current >= limit then
+            wait = bucket_start + window * (2 - limit / current) - now
+        else
+            wait = bucket_start + window * (1 - (limit - current) / previous)
+                - now
+        end
+        wait = math.max(1, math.ceil(wait))
+        if limited == 0 or wait > retry_after then
+            retry_after = wait
+            decisive = (i + 1) / 2
+        end
+        limited = 1
+    elseif limited == 0 then
+        local left = math.max(0, math.floor(limit - estimate - 1))
+        if remaining < 0 or left < remaining then
+            remaining = left
+            decisive = (i + 1) / 2
+        end
+    end
+
+    table.insert(updates, 'b' .. window)
+    table.insert(updates, bucket)
+    table.insert(updates, 'c' .. window)
+    table.insert(updates, current + 1)
+    table.insert(updates, 'p' .. window)
+    table.insert(updates, previous)
+end
+
+if limited == 1 then
+    return {1, 0, retry_after, decisive}
+end
+
+redis.call('HSET', key, unpack(updates))
+redis.call('PEXPIRE', key, max_window * 2)
+return {0, remaining, 0, decisive}
+"""
@@ -0,0 +1,57 @@
+from time import perf_counter
+
+from redis.asyncio import BlockingConnectionPool, UnixDomainSocketConnection
+
+from core.metrics import (
+    REDIS_POOL_IDLE,
+    REDIS_POOL_IN_USE,
+    REDIS_POOL_SIZE,
+    REDIS_POOL_WAIT_SECONDS,
+)
+from entrypoint.config import RedisConfig
+
+
+class InstrumentedBlockingConnectionPool(BlockingConnectionPool):
+    async def get_connection(self, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return await super().get_connection(*args, **kwargs)
+        finally:
+            REDIS_POOL_WAIT_SECONDS.observe(perf_counter() - start)
+            self._update_gauges()
+
+    async def release(self, connection):
+        await super().release(connection)
+        self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        REDIS_POOL_IN_USE.set(len(self._in_use_connections))
+        REDIS_POOL_IDLE.set(len(self._available_connections))
+
+
+def create_redis_pool(config: RedisConfig) -> BlockingConnectionPool:
+    # A full pool makes callers wait up to POOL_TIMEOUT for a connection
+    # instead of opening more, so MAX_CONNECTIONS bounds what each worker
+    # holds open against Redis.
+    kwargs = {
+        "max_connections": config.MAX_CONNECTIONS,
+        "timeout": config.POOL_TIMEOUT,
+        "socket_timeout": config.SOCKET_TIMEOUT,
+        "socket_connect_timeout": config.SOCKET_CONNECT_TIMEOUT,
+        "health_check_interval": config.HEALTH_CHECK_INTERVAL,
+    }
+    if config.UNIX_SOCKET:
+        pool = InstrumentedBlockingConnectionPool(
+            connection_class=UnixDomainSocketConnection,
+            path=config.UNIX_SOCKET,
+            **kwargs,
+        )
+    else:
+        pool = InstrumentedBlockingConnectionPool(
+            host=config.HOST,
+            port=config.PORT,
+            socket_keepalive=config.SOCKET_KEEPALIVE,
+            **kwargs,
+        )
+    REDIS_POOL_SIZE.set(config.MAX_CONNECTIONS)
+    return pool
@@ -0,0 +1,89 @@
+import hashlib
+from collections import OrderedDict
+from time import time
+from typing import NamedTuple
+
+from schemas.user import UserResponse
+
+
+class CachedToken(NamedTuple):
+    claims: dict
+    user: UserResponse
+    # users.token_version the user was loaded or verified at.
+    version: int
+    expires_at: float
+
+
+class TokenCache:
+    def __init__(self, max_size: int, ttl: int):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[bytes, CachedToken] = OrderedDict()
+        self._user_keys: dict[int, set[bytes]] = {}
+
+    def get(self, token: str) -> CachedToken | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time():
+            self._discard(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        token: str,
+        claims: dict,
+        user: UserResponse,
+        version: int,
+    ) -> None:
+        if self._max_size <= 0:
+            return
+
+        expires_at = time() + self._ttl
+        if "exp" in claims:
+            expires_at = min(expires_at, float(claims["exp"]))
+
+        key = self._key(token)
+        self._discard(key)
+        self._entries[key] = CachedToken(
+            claims,
+            user,
+            version,
+            expires_at,
+        )
+        self._user_keys.setdefault(user.id, set()).add(key)
+
+        while len(self._entries) > self._max_size:
+            oldest_key = next(iter(self._entries))
+            self._discard(oldest_key)
+
+    def invalidate_user(self, user_id: int) -> None:
+        for key in self._user_keys.pop(user_id, ()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._user_keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def _discard(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        user_keys = self._user_keys.get(entry.user.id)
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._user_keys[entry.user.id]
@@ -0,0 +1,47 @@
+from time import perf_counter
+
+from redis.asyncio import Redis
+
+from core.metrics import REDIS_SECONDS
+
+_GET_SECONDS = REDIS_SECONDS.labels("TokenVersionStore.get")
+_SET_SECONDS = REDIS_SECONDS.labels("TokenVersionStore.set")
+
+# Versions only grow, so a reader re-seeding the value it loaded before a
+# concurrent update committed can never roll the cached version back.
+_SET_IF_NEWER = """
+local current = tonumber(redis.call('GET', KEYS[1]))
+if current and current >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+class TokenVersionStore:
+    # A cache of users.token_version. A missing key (flushed or evicted)
+    # means the version is unknown, never that it is 0.
+    key_prefix = "user:token_version"
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self._set_if_newer = redis.register_script(_SET_IF_NEWER)
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    async def get(self, user_id: int) -> int | None:
+        start = perf_counter()
+        try:
+            version = await self.redis.get(self._key(user_id))
+        finally:
+            _GET_SECONDS.observe(perf_counter() - start)
+        return int(version) if version is not None else None
+
+    async def set(self, user_id: int, version: int) -> None:
+        start = perf_counter()
+        try:
+            await self._set_if_newer(keys=[self._key(user_id)], args=[version])
+        finally:
+            _SET_SECONDS.observe(perf_counter() - start)
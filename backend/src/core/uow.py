@@ -1,15 +1,53 @@
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = logging.getLogger(__name__)
+
 
 class UnitOfWork:
     def __init__(self, session: AsyncSession):
         self.session = session
+        self._writing = False
+        self._on_commit: list[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def writing(self) -> bool:
+        return self._writing
+
+    def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        self._on_commit.append(callback)
 
     async def __aenter__(self):
+        self._writing = True
         return self
 
     async def __aexit__(self, exception_type, exception, traceback):
+        self._writing = False
+        callbacks, self._on_commit = self._on_commit, []
         if exception_type:
             await self.session.rollback()
-        else:
-            await self.session.commit()
+            return
+
+        await self.session.commit()
+        # The data is already committed, so a failing hook is logged
+        # rather than turned into an error for the caller.
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                logger.exception("on_commit callback failed")
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator["UnitOfWork"]:
+        # The session only checks out a connection on its first query.
+        # Closing it once the reads are done hands that connection back to
+        # the pool right away instead of holding it, idle in transaction,
+        # until the request scope ends. Loaded objects stay usable.
+        try:
+            yield self
+        finally:
+            if not self._writing and self.session.in_transaction():
+                await self.session.close()
@@ -183,7 +183,10 @@ async def main():
     try:
         args = parse_args()
         container = create_async_container(get_providers())
-        await create_user_from_args(args, dishka_container=container)
+        try:
+            await create_user_from_args(args, dishka_container=container)
+        finally:
+            await container.close()
 
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.")
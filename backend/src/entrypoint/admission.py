@@ -0,0 +1,13 @@
+from core.admission import Priority, route_priority
+
+# Routes not listed here are admitted with Priority.NORMAL.
+ROUTE_PRIORITIES = (
+    route_priority("GET", "/api/ping", Priority.CRITICAL),
+    route_priority("GET", "/metrics", Priority.CRITICAL),
+    route_priority("GET", "/api/users/me", Priority.HIGH),
+    route_priority("POST", "/api/users/refresh", Priority.HIGH),
+    route_priority("POST", "/api/users/logout", Priority.HIGH),
+    # bcrypt-bound, and retried by clients anyway.
+    route_priority("POST", "/api/users/register", Priority.LOW),
+    route_priority("POST", "/api/users/login", Priority.LOW),
+)
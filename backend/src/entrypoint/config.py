@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from dotenv import find_dotenv, load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -14,6 +15,12 @@ class DatabaseConfig(BaseSettings):
     HOST: str
     PORT: int
     NAME: str
+    POOL_SIZE: int = 5
+    MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: float = 30  # seconds
+    POOL_RECYCLE: int = 1800  # seconds
+    POOL_PRE_PING: bool = True
+    STATEMENT_CACHE_SIZE: int = 100
 
     model_config = SettingsConfigDict(
         env_prefix="POSTGRES_",
@@ -34,9 +41,17 @@ class AuthJWT(BaseSettings):
 
     PRIVATE_KEY: Path = _certs_dir / "jwt-private.pem"
     PUBLIC_KEY: Path = _certs_dir / "jwt-public.pem"
-    ALGORITM: str = "RS256"
+    ALGORITM: Literal["RS256", "ES256", "EdDSA"] = "RS256"
+    KEY_ID: str | None = None
+    # Extra public keys accepted during rotation, one <kid>.pem per key.
+    VERIFICATION_KEYS_DIR: Path | None = _certs_dir / "verification"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    TOKEN_CACHE_SIZE: int = 10_000
+    TOKEN_CACHE_TTL: int = 30  # seconds
+    # Trust identity and role claims in access tokens instead of loading
+    # the user on every request.
+    STATELESS: bool = False
 
 
 class RedisConfig(BaseSettings):
@@ -48,6 +63,92 @@ class RedisConfig(BaseSettings):
 
     PORT: int
     HOST: str
+    # Connects over this unix socket instead of HOST:PORT when set.
+    UNIX_SOCKET: str | None = None
+    # Per worker process.
+    MAX_CONNECTIONS: int = 32
+    POOL_TIMEOUT: float = 1  # seconds to wait for a free connection
+    SOCKET_TIMEOUT: float = 1
+    SOCKET_CONNECT_TIMEOUT: float = 1
+    SOCKET_KEEPALIVE: bool = True
+    # A connection idle for longer is pinged before it is reused.
+    HEALTH_CHECK_INTERVAL: int = 30  # seconds
+
+
+class RateLimiterConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="RATE_LIMITER_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    ALGORITHM: Literal["sliding_log", "sliding_counter"] = "sliding_log"
+    TIMEOUT: float = 0.05  # seconds per Redis check
+    # Consecutive failed checks that open the breaker, and how long it
+    # stays open before a single check probes Redis again.
+    BREAKER_FAILURE_THRESHOLD: int = 5
+    BREAKER_RESET_TIMEOUT: float = 5  # seconds
+
+
+class AdmissionConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="ADMISSION_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    ENABLED: bool = True
+    # Per worker process.
+    MAX_IN_FLIGHT: int = 64
+    MAX_QUEUE: int = 128
+    QUEUE_TIMEOUT: float = 2  # seconds
+    RETRY_AFTER: int = 1  # seconds
+
+
+class DeadlineConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="DEADLINE_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    ENABLED: bool = True
+    # For routes without their own entry in entrypoint/deadlines.py.
+    DEFAULT_TIMEOUT: float = 30  # seconds
+
+
+class MessageCacheConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="MESSAGE_CACHE_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    ENABLED: bool = True
+    TTL: float = 60  # seconds
+    LOCK_TTL: float = 2
+    # How long a reader waits for another one to fill a missing entry
+    # before loading it from the database itself.
+    WAIT_TIMEOUT: float = 0.5
+    EARLY_REFRESH_BETA: float = 1.0
+
+
+class OutboxConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="OUTBOX_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    BATCH_SIZE: int = 100
+    # Fallback poll for rows committed by other processes; commits in
+    # this process wake the publisher right away.
+    POLL_INTERVAL: float = 1.0
+    # Failed publishes back off exponentially from RETRY_BASE up to
+    # RETRY_MAX; after MAX_ATTEMPTS the row is dead-lettered.
+    MAX_ATTEMPTS: int = 10
+    RETRY_BASE: float = 1.0  # seconds
+    RETRY_MAX: float = 300.0  # seconds
 
 
 class EmailConfig(BaseSettings):
@@ -62,6 +163,12 @@ class EmailConfig(BaseSettings):
     USE_SSL: bool
     PASSWORD: str
     USERNAME: str
+    # Per-worker SMTP session pool.
+    POOL_SIZE: int = 8
+    TIMEOUT: float = 60
+    NOOP_INTERVAL: float = 15  # seconds idle before a session is re-checked
+    MAX_IDLE: float = 60  # seconds idle before a session is dropped
+    SEND_RETRIES: int = 2
 
 
 class FrontendConfig(BaseSettings):
@@ -74,8 +181,31 @@ class FrontendConfig(BaseSettings):
     URL: str
 
 
+class PasswordHasherConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="PASSWORD_HASHER_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    EXECUTOR: Literal["thread", "process"] = "thread"
+    WORKERS: int = 2
+    MAX_QUEUE: int = 32
+    ROUNDS: int = 12
+    RETRY_AFTER: int = 1  # seconds
+
+
 class OTPConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="OTP_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
     TTL: int = 300  # seconds
+    # "database" keeps secrets in users.otp_secret for setups without Redis.
+    BACKEND: Literal["redis", "database"] = "redis"
+    MAX_ATTEMPTS: int = 5
 
 
 class RabbitMQConfig(BaseSettings):
@@ -88,6 +218,20 @@ class RabbitMQConfig(BaseSettings):
     URL: str
 
 
+class WorkerConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="WORKER_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    PROCESSES: int | None = None  # one per available CPU when unset
+    MAX_ASYNC_TASKS: int = 100  # per process
+    # Unacknowledged messages RabbitMQ delivers to each process.
+    PREFETCH: int = 10
+    SHUTDOWN_TIMEOUT: float = 30  # seconds
+
+
 class APPConfig(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="APP_",
@@ -98,6 +242,11 @@ class APPConfig(BaseSettings):
     NAME: str
     HOST: str
     PORT: int
+    WORKERS: int | None = None  # one per available CPU when unset
+    KEEPALIVE_TIMEOUT: int = 5  # seconds
+    BACKLOG: int = 2048
+    # Time in-flight requests get to finish after SIGTERM.
+    GRACEFUL_TIMEOUT: int = 30  # seconds
 
 
 class Config(BaseSettings):
@@ -109,11 +258,18 @@ class Config(BaseSettings):
     database: DatabaseConfig = DatabaseConfig()
     auth_jwt: AuthJWT = AuthJWT()
     redis: RedisConfig = RedisConfig()
+    rate_limiter: RateLimiterConfig = RateLimiterConfig()
+    admission: AdmissionConfig = AdmissionConfig()
+    deadline: DeadlineConfig = DeadlineConfig()
+    message_cache: MessageCacheConfig = MessageCacheConfig()
     email: EmailConfig = EmailConfig()
+    outbox: OutboxConfig = OutboxConfig()
     rabbitmq: RabbitMQConfig = RabbitMQConfig()
+    worker: WorkerConfig = WorkerConfig()
     frontend: FrontendConfig = FrontendConfig()
     app: APPConfig = APPConfig()
     otp: OTPConfig = OTPConfig()
+    password_hasher: PasswordHasherConfig = PasswordHasherConfig()
 
 
 def create_config() -> Config:
@@ -0,0 +1,16 @@
+from core.deadline import route_deadline
+
+# Routes not listed here get DEADLINE_DEFAULT_TIMEOUT; None disables the
+# deadline for a route.
+ROUTE_DEADLINES = (
+    route_deadline("GET", "/api/ping", 1),
+    route_deadline("GET", "/metrics", None),
+    route_deadline("GET", "/api/users/me", 5),
+    route_deadline("GET", "/api/users/", 10),
+    route_deadline("GET", "/api/users/{user_id}", 5),
+    route_deadline("GET", "/api/messages/", 10),
+    route_deadline("GET", "/api/messages/{msg_id}", 5),
+    # bcrypt may queue behind other hashes while the pool is busy.
+    route_deadline("POST", "/api/users/register", 15),
+    route_deadline("POST", "/api/users/login", 15),
+)
@@ -1,6 +1,9 @@
 from entrypoint.ioc.auth import AuthProvider
 from entrypoint.ioc.config import ConfigProvider
 from entrypoint.ioc.database import DatabaseProvider
+from entrypoint.ioc.deadline import DeadlineProvider
+from entrypoint.ioc.outbox import OutboxProvider
+from entrypoint.ioc.password_hasher import PasswordHasherProvider
 from entrypoint.ioc.rate_limiter import RateLimiterProvider
 from entrypoint.ioc.redis import RedisProvider
 from entrypoint.ioc.repositories import RepositoryProvider
@@ -9,9 +12,12 @@ from entrypoint.ioc.servicies import ServiceProvider
 __all__ = [
     "AuthProvider",
     "DatabaseProvider",
+    "DeadlineProvider",
     "RepositoryProvider",
     "ServiceProvider",
     "ConfigProvider",
     "RateLimiterProvider",
     "RedisProvider",
+    "PasswordHasherProvider",
+    "OutboxProvider",
 ]
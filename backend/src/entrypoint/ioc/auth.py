@@ -1,19 +1,48 @@
 from dishka import Provider, Scope, provide
 from fastapi import HTTPException, Request, status
 from jwt import InvalidTokenError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
+from core.token_cache import TokenCache
+from core.token_version import TokenVersionStore
+from entrypoint.config import Config
 from schemas.user import UserResponse
 from services.user import UserService
 from utils.jwt_utils import decode_jwt
 
 
+async def _current_version(
+    token_versions: TokenVersionStore,
+    user_id: int,
+) -> int | None:
+    try:
+        return await token_versions.get(user_id)
+    except (RedisError, OSError):
+        return None
+
+
 class AuthProvider(Provider):
     scope = Scope.REQUEST
 
+    @provide(scope=Scope.APP)
+    def get_token_cache(self, config: Config) -> TokenCache:
+        return TokenCache(
+            max_size=config.auth_jwt.TOKEN_CACHE_SIZE,
+            ttl=config.auth_jwt.TOKEN_CACHE_TTL,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_token_version_store(self, redis: Redis) -> TokenVersionStore:
+        return TokenVersionStore(redis)
+
     @provide
     async def get_current_user(
         self,
         user_service: UserService,
+        token_cache: TokenCache,
+        token_versions: TokenVersionStore,
+        config: Config,
         request: Request,
     ) -> UserResponse:
         authorization = request.headers.get("Authorization")
@@ -40,6 +69,16 @@ class AuthProvider(Provider):
                 detail="No token provided",
             )
 
+        cached = token_cache.get(token)
+        if cached is not None:
+            # update_user only clears the cache of the worker that served
+            # it; the shared version tells every other worker whether the
+            # cached user is still current. Unknown means reload.
+            version = await _current_version(token_versions, cached.user.id)
+            if version is not None and version == cached.version:
+                return cached.user
+            token_cache.invalidate_user(cached.user.id)
+
         try:
             decoded_token = decode_jwt(token)
         except InvalidTokenError as err:
@@ -50,6 +89,19 @@ class AuthProvider(Provider):
 
         user_id = int(decoded_token.get("sub"))
 
+        if config.auth_jwt.STATELESS and "ver" in decoded_token:
+            version = await _current_version(token_versions, user_id)
+            # A stale or unknown version falls through to the database.
+            if version == decoded_token["ver"]:
+                user_response = UserResponse(
+                    id=user_id,
+                    email=decoded_token["email"],
+                    username=decoded_token["username"],
+                    role=decoded_token["role"],
+                )
+                token_cache.set(token, decoded_token, user_response, version)
+                return user_response
+
         if user_id:
             user = await user_service.get_user_by_id(user_id)
             if not user:
@@ -57,10 +109,21 @@ class AuthProvider(Provider):
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="User not found",
                 )
+            try:
+                await token_versions.set(user.id, user.token_version)
+            except (RedisError, OSError):
+                pass
 
-            return UserResponse(
+            user_response = UserResponse(
                 id=user.id,
                 email=user.email,
                 username=user.username,
                 role=user.role,
             )
+            token_cache.set(
+                token,
+                decoded_token,
+                user_response,
+                user.token_version,
+            )
+            return user_response
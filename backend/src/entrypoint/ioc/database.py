@@ -1,25 +1,58 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterable
 
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
-from entrypoint.config import config
 from dishka import Provider, Scope, provide
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+)
+
+from core.database import create_engine
+from core.deadline import Deadline
+from entrypoint.config import Config
 
 
 class DatabaseProvider(Provider):
     scope = Scope.REQUEST
 
-    engine = create_async_engine(
-        config.database.get_db_url(),
-        future=True,
-    )
-    session_factory = async_sessionmaker(
-        engine,
-        expire_on_commit=False,
-        autoflush=False,
-    )
+    @provide(scope=Scope.APP)
+    async def get_engine(self, config: Config) -> AsyncIterable[AsyncEngine]:
+        engine = create_engine(config.database)
+        yield engine
+        await engine.dispose()
+
+    @provide(scope=Scope.APP)
+    def get_session_factory(
+        self,
+        engine: AsyncEngine,
+    ) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(
+            engine,
+            expire_on_commit=False,
+            autoflush=False,
+        )
 
     @provide
-    async def get_db_session(self) -> AsyncGenerator[AsyncSession]:
-        async with self.session_factory() as session:
+    async def get_db_session(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        deadline: Deadline,
+    ) -> AsyncIterable[AsyncSession]:
+        async with session_factory() as session:
+            if deadline.expires_at is not None:
+                _apply_statement_timeout(session, deadline)
             yield session
+
+
+def _apply_statement_timeout(session: AsyncSession, deadline: Deadline):
+    # Postgres stops a statement that outlives the request on its own,
+    # even if cancelling the request never reaches the connection. SET
+    # LOCAL ends with the transaction, so the pooled connection goes back
+    # with the server default.
+    @event.listens_for(session.sync_session, "after_begin")
+    def set_statement_timeout(session, transaction, connection):
+        milliseconds = max(1, int(deadline.remaining() * 1000))
+        connection.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {milliseconds}",
+        )
@@ -0,0 +1,11 @@
+from dishka import Provider, Scope, provide
+
+from core.deadline import Deadline, current_deadline
+
+
+class DeadlineProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    def get_deadline(self) -> Deadline:
+        return current_deadline.get()
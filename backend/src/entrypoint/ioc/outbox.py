@@ -0,0 +1,41 @@
+from collections.abc import AsyncIterable
+
+from dishka import Provider, Scope, provide
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core import broker
+from core.outbox import Outbox, OutboxPublisher
+from core.uow import UnitOfWork
+from entrypoint.config import Config
+from repositories.outbox import OutboxRepositoryI
+
+
+class OutboxProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide(scope=Scope.APP)
+    async def get_outbox_publisher(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        config: Config,
+    ) -> AsyncIterable[OutboxPublisher]:
+        publisher = OutboxPublisher(
+            session_factory,
+            broker,
+            batch_size=config.outbox.BATCH_SIZE,
+            poll_interval=config.outbox.POLL_INTERVAL,
+            max_attempts=config.outbox.MAX_ATTEMPTS,
+            retry_base=config.outbox.RETRY_BASE,
+            retry_max=config.outbox.RETRY_MAX,
+        )
+        yield publisher
+        await publisher.stop()
+
+    @provide
+    def get_outbox(
+        self,
+        uow: UnitOfWork,
+        repository: OutboxRepositoryI,
+        publisher: OutboxPublisher,
+    ) -> Outbox:
+        return Outbox(uow, repository, publisher)
@@ -0,0 +1,16 @@
+from collections.abc import Iterable
+
+from dishka import Provider, Scope, provide
+
+from core.password_hasher import PasswordHasher
+from entrypoint.config import Config
+
+
+class PasswordHasherProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def get_password_hasher(self, config: Config) -> Iterable[PasswordHasher]:
+        password_hasher = PasswordHasher.from_config(config)
+        yield password_hasher
+        password_hasher.shutdown()
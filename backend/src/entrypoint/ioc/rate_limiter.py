@@ -1,12 +1,24 @@
 from dishka import Provider, Scope, provide
 from redis.asyncio import Redis
 
-from core.rate_limiter import RateLimiter
+from core.circuit_breaker import CircuitBreaker
+from core.rate_limiter import Algorithm, RateLimiter
+from entrypoint.config import Config
 
 
 class RateLimiterProvider(Provider):
-    scope = Scope.REQUEST
+    scope = Scope.APP
 
     @provide
-    def get_rate_limiter(self, redis: Redis) -> RateLimiter:
-        return RateLimiter(redis)
+    def get_rate_limiter(self, redis: Redis, config: Config) -> RateLimiter:
+        limiter_config = config.rate_limiter
+        return RateLimiter(
+            redis,
+            algorithm=Algorithm(limiter_config.ALGORITHM),
+            timeout=limiter_config.TIMEOUT,
+            breaker=CircuitBreaker(
+                "rate_limiter",
+                failure_threshold=limiter_config.BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=limiter_config.BREAKER_RESET_TIMEOUT,
+            ),
+        )
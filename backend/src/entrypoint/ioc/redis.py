@@ -1,6 +1,9 @@
+from collections.abc import AsyncIterable
+
 from dishka import Provider, Scope, provide
-from redis.asyncio import Redis
+from redis.asyncio import ConnectionPool, Redis
 
+from core.redis import create_redis_pool
 from entrypoint.config import Config
 
 
@@ -8,8 +11,14 @@ class RedisProvider(Provider):
     scope = Scope.APP
 
     @provide
-    def get_redis(self, config: Config) -> Redis:
-        return Redis(
-            host=config.redis.HOST,
-            port=config.redis.PORT,
-        )
+    async def get_redis_pool(
+        self,
+        config: Config,
+    ) -> AsyncIterable[ConnectionPool]:
+        pool = create_redis_pool(config.redis)
+        yield pool
+        await pool.aclose()
+
+    @provide
+    def get_redis(self, pool: ConnectionPool) -> Redis:
+        return Redis(connection_pool=pool)
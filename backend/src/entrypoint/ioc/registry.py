@@ -7,6 +7,9 @@ from entrypoint.ioc import (
     AuthProvider,
     ConfigProvider,
     DatabaseProvider,
+    DeadlineProvider,
+    OutboxProvider,
+    PasswordHasherProvider,
     RateLimiterProvider,
     RedisProvider,
     RepositoryProvider,
@@ -17,6 +20,7 @@ from entrypoint.ioc import (
 def get_providers() -> Iterable[Provider]:
     return (
         DatabaseProvider(),
+        DeadlineProvider(),
         AuthProvider(),
         ServiceProvider(),
         RepositoryProvider(),
@@ -24,4 +28,6 @@ def get_providers() -> Iterable[Provider]:
         ConfigProvider(),
         RedisProvider(),
         RateLimiterProvider(),
+        PasswordHasherProvider(),
+        OutboxProvider(),
     )
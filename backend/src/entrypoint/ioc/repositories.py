@@ -1,14 +1,24 @@
 from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import RedisCache
 from core.uow import UnitOfWork
+from entrypoint.config import Config
 from repositories import (
     IUserRepository,
     UserRepository,
     # MessageRepository,
     # MessageRepositoryI,
 )
+from repositories.cached_message import CachedMessageRepository
 from repositories.message import MessageRepository, MessageRepositoryI
+from repositories.outbox import OutboxRepository, OutboxRepositoryI
+from repositories.otp import (
+    DatabaseOTPRepository,
+    OTPRepositoryI,
+    RedisOTPRepository,
+)
 
 
 class RepositoryProvider(Provider):
@@ -18,12 +28,61 @@ class RepositoryProvider(Provider):
     def get_user_repository(self, session: AsyncSession) -> IUserRepository:
         return UserRepository(session)
 
+    @provide(scope=Scope.APP)
+    def get_message_cache(self, redis: Redis, config: Config) -> RedisCache:
+        return RedisCache(
+            redis,
+            name="message",
+            ttl=config.message_cache.TTL,
+            lock_ttl=config.message_cache.LOCK_TTL,
+            wait_timeout=config.message_cache.WAIT_TIMEOUT,
+            beta=config.message_cache.EARLY_REFRESH_BETA,
+        )
+
     @provide
     def get_message_repository(
         self,
         session: AsyncSession,
+        uow: UnitOfWork,
+        cache: RedisCache,
+        config: Config,
     ) -> MessageRepositoryI:
-        return MessageRepository(session)
+        repository = MessageRepository(session)
+        if not config.message_cache.ENABLED:
+            return repository
+        return CachedMessageRepository(repository, cache, uow)
+
+    @provide(scope=Scope.APP)
+    def get_redis_otp_repository(
+        self,
+        redis: Redis,
+        config: Config,
+    ) -> RedisOTPRepository:
+        # Holds no per-request state, so the Lua script is registered
+        # once per worker rather than on every request.
+        return RedisOTPRepository(
+            redis,
+            ttl=config.otp.TTL,
+            max_attempts=config.otp.MAX_ATTEMPTS,
+        )
+
+    @provide
+    def get_otp_repository(
+        self,
+        session: AsyncSession,
+        redis_repository: RedisOTPRepository,
+        config: Config,
+    ) -> OTPRepositoryI:
+        if config.otp.BACKEND == "database":
+            return DatabaseOTPRepository(session)
+        return redis_repository
+
+    @provide
+    def get_outbox_repository(
+        self,
+        session: AsyncSession,
+    ) -> OutboxRepositoryI:
+        return OutboxRepository(session)
 
     @provide
     def get_unit_of_work(self, session: AsyncSession) -> UnitOfWork:
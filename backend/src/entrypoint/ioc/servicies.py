@@ -1,5 +1,9 @@
 from dishka import Provider, Scope, provide
 
+from core.outbox import Outbox
+from core.password_hasher import PasswordHasher
+from core.token_cache import TokenCache
+from core.token_version import TokenVersionStore
 from core.uow import UnitOfWork
 
 # from repositories import IUserRepository
@@ -7,6 +11,7 @@ from core.uow import UnitOfWork
 # from services import UserService, MessageService
 from repositories.user import IUserRepository
 from repositories.message import MessageRepositoryI
+from repositories.otp import OTPRepositoryI
 from services.user import UserService
 from services.message import MessageService
 
@@ -19,8 +24,21 @@ class ServiceProvider(Provider):
         self,
         uow: UnitOfWork,
         user_repository: IUserRepository,
+        password_hasher: PasswordHasher,
+        token_cache: TokenCache,
+        token_versions: TokenVersionStore,
+        otp_repository: OTPRepositoryI,
+        outbox: Outbox,
     ) -> UserService:
-        return UserService(uow, user_repository)
+        return UserService(
+            uow,
+            user_repository,
+            password_hasher,
+            token_cache,
+            token_versions,
+            otp_repository,
+            outbox,
+        )
 
     @provide
     def get_message_service(
@@ -0,0 +1,55 @@
+from core.rate_limiter import Strategy, route_policy
+
+RATE_LIMIT_POLICIES = (
+    route_policy(
+        "GET",
+        "/api/ping",
+        "30/s;200/m;3000/h",
+        strategy=Strategy.IP,
+        local_fraction=1.0,
+    ),
+    route_policy(
+        "POST",
+        "/api/users/register",
+        "3/m;10/h;20/d",
+        strategy=Strategy.IP,
+        local_fraction=1.0,
+    ),
+    route_policy(
+        "GET",
+        "/api/users/verify-email",
+        "5/m;20/h",
+        strategy=Strategy.IP,
+    ),
+    route_policy(
+        "POST",
+        "/api/users/check-code",
+        "5/m;20/h",
+        strategy=Strategy.IP,
+        local_fraction=1.0,
+        # Guessing codes must stay limited across workers.
+        fail_open=False,
+    ),
+    route_policy(
+        "POST",
+        "/api/users/resend-otp",
+        "2/m;5/h",
+        strategy=Strategy.IP,
+        # Every request sends an email.
+        fail_open=False,
+    ),
+    route_policy(
+        "POST",
+        "/api/users/login",
+        "5/m;20/h;50/d",
+        strategy=Strategy.IP,
+        local_fraction=1.0,
+    ),
+    route_policy(
+        "POST",
+        "/api/users/refresh",
+        "10/m;100/h",
+        strategy=Strategy.IP,
+        local_fraction=1.0,
+    ),
+)
@@ -1,36 +1,59 @@
 import logging
+import os
 from collections.abc import Iterable
 from contextlib import asynccontextmanager
 
 from dishka import Provider, make_async_container
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from prometheus_client import multiprocess
+from redis.asyncio import Redis
 
-from clients import RedisClient
 from core import broker
+from core.admission import AdmissionMiddleware
+from core.deadline import DeadlineMiddleware
+from core.metrics import MetricsMiddleware
+from core.outbox import OutboxPublisher
+from core.rate_limiter import RateLimitMiddleware
+from entrypoint.admission import ROUTE_PRIORITIES
 from entrypoint.config import Config, create_config, config
+from entrypoint.deadlines import ROUTE_DEADLINES
+from entrypoint.rate_limits import RATE_LIMIT_POLICIES
+from utils.pagination import NEXT_CURSOR_HEADER
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    config = create_config()
-    redis_client = RedisClient(config)
-    redis = redis_client.get_redis()
+    container = app.state.dishka_container
+    # The same pool backs every Redis user in this worker; closing the
+    # container below closes it.
+    redis = await container.get(Redis)
     await redis.ping()
     logging.info("Redis is working")
 
     await broker.startup()
+    outbox_publisher = await container.get(OutboxPublisher)
+    outbox_publisher.start()
 
     yield
 
+    await outbox_publisher.stop()
     await broker.shutdown()
 
-    await redis.aclose()
+    await container.close()
     logging.info("Redis disconnected")
 
+    # Drops this worker's live gauges from the shared metrics directory.
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
+
 
 def create_app() -> FastAPI:
-    app = FastAPI(lifespan=lifespan)
+    app = FastAPI(
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
     return app
 
 
@@ -42,15 +65,45 @@ def create_async_container(providers: Iterable[Provider]):
     )
 
 
-def configure_app(app: FastAPI, root_router: APIRouter) -> None:
+def configure_app(
+    app: FastAPI,
+    root_router: APIRouter,
+    metrics_router: APIRouter,
+) -> None:
     app.include_router(root_router)
+    app.include_router(metrics_router)
 
 
 def configure_middlewares(app: FastAPI) -> None:
+    app.add_middleware(
+        RateLimitMiddleware,
+        policies=RATE_LIMIT_POLICIES,
+    )
+    # Outside the rate limiter, so a saturated worker sheds requests
+    # before spending a Redis round trip on them.
+    if config.admission.ENABLED:
+        app.add_middleware(
+            AdmissionMiddleware,
+            priorities=ROUTE_PRIORITIES,
+            max_in_flight=config.admission.MAX_IN_FLIGHT,
+            max_queue=config.admission.MAX_QUEUE,
+            queue_timeout=config.admission.QUEUE_TIMEOUT,
+            retry_after=config.admission.RETRY_AFTER,
+        )
+    # Outermost of the three, so time spent queued for admission and in
+    # the rate limiter counts against the request's deadline.
+    if config.deadline.ENABLED:
+        app.add_middleware(
+            DeadlineMiddleware,
+            deadlines=ROUTE_DEADLINES,
+            default_timeout=config.deadline.DEFAULT_TIMEOUT,
+        )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=[config.frontend.URL],
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
+    app.add_middleware(MetricsMiddleware)
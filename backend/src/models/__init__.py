@@ -1,10 +1,12 @@
 from models.base import Base
 from models.user import RoleEnum, User
 from models.message import Message
+from models.outbox import OutboxMessage
 
 __all__ = [
     "Base",
     "User",
     "RoleEnum",
     "Message",
+    "OutboxMessage",
 ]
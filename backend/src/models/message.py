@@ -1,8 +1,10 @@
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import mapped_column, Mapped
 
 from models import Base
 
 
 class Message(Base):
+    __table_args__ = (Index("ix_messages_created_at", "created_at"),)
+
     content: Mapped[str] = mapped_column(String(255))
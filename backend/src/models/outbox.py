@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models import Base
+
+
+class OutboxMessage(Base):
+    __table_args__ = (
+        # The publisher only ever reads rows that are still pending.
+        Index(
+            "ix_outbox_messages_pending",
+            "next_attempt_at",
+            postgresql_where=text("dead_at IS NULL"),
+        ),
+    )
+
+    task_name: Mapped[str] = mapped_column(String(255))
+    kwargs: Mapped[dict[str, Any]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.now(),
+        nullable=False,
+    )
+    # Set once the row has failed OUTBOX_MAX_ATTEMPTS times; it is kept
+    # for inspection and never published again.
+    dead_at: Mapped[datetime | None] = mapped_column(
+        DateTime,
+        nullable=True,
+    )
@@ -1,7 +1,7 @@
 import uuid
 from enum import StrEnum
 
-from sqlalchemy import UUID, Boolean
+from sqlalchemy import UUID, Boolean, Index, Integer, text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column
@@ -16,6 +16,15 @@ class RoleEnum(StrEnum):
 
 
 class User(Base):
+    __table_args__ = (
+        Index("ix_users_created_at", "created_at"),
+        Index(
+            "ix_users_unverified_created_at",
+            "created_at",
+            postgresql_where=text("email_verified = false"),
+        ),
+    )
+
     username: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
@@ -45,10 +54,18 @@ class User(Base):
     )
     token: Mapped[uuid.UUID] = mapped_column(
         UUID(),
-        default=uuid.uuid4(),
+        default=uuid.uuid4,
         nullable=True,
+        index=True,
     )
     otp_secret: Mapped[str] = mapped_column(
         String(),
         nullable=True,
     )
+    # Bumped on every update; stateless access tokens carry it as "ver".
+    token_version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
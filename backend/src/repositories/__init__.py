@@ -1,9 +1,22 @@
 from repositories.user import UserRepository, IUserRepository
 from repositories.message import MessageRepository, MessageRepositoryI
+from repositories.cached_message import CachedMessageRepository
+from repositories.outbox import OutboxRepository, OutboxRepositoryI
+from repositories.otp import (
+    DatabaseOTPRepository,
+    OTPRepositoryI,
+    RedisOTPRepository,
+)
 
 __all__ = [
     "UserRepository",
     "IUserRepository",
     "MessageRepositoryI",
     "MessageRepository",
+    "CachedMessageRepository",
+    "OTPRepositoryI",
+    "RedisOTPRepository",
+    "DatabaseOTPRepository",
+    "OutboxRepositoryI",
+    "OutboxRepository",
 ]
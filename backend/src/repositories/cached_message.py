@@ -0,0 +1,127 @@
+from datetime import datetime
+
+from core.cache import RedisCache
+from core.uow import UnitOfWork
+from models import Message
+from repositories.message import MessageRepositoryI
+from schemas.message import MessageCreate, MessageUpdate
+
+LISTS_KEY = "message:lists"
+
+
+def _message_key(msg_id: int) -> str:
+    return f"message:{msg_id}"
+
+
+def _dump(message: Message) -> list:
+    return [
+        message.id,
+        message.content,
+        message.created_at.isoformat(),
+        message.updated_at.isoformat(),
+    ]
+
+
+def _load(row: list) -> Message:
+    msg_id, content, created_at, updated_at = row
+    return Message(
+        id=msg_id,
+        content=content,
+        created_at=datetime.fromisoformat(created_at),
+        updated_at=datetime.fromisoformat(updated_at),
+    )
+
+
+class CachedMessageRepository(MessageRepositoryI):
+    def __init__(
+        self,
+        repository: MessageRepositoryI,
+        cache: RedisCache,
+        uow: UnitOfWork,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.uow = uow
+
+    async def get(self, msg_id: int) -> Message | None:
+        # Inside a write the session may hold uncommitted changes, which
+        # must never reach the cache.
+        if self.uow.writing:
+            return await self.repository.get(msg_id)
+
+        async def load() -> list | None:
+            message = await self.repository.get(msg_id)
+            return _dump(message) if message is not None else None
+
+        row = await self.cache.get_or_load(_message_key(msg_id), "v", load)
+        return _load(row) if row is not None else None
+
+    async def get_all(
+        self,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[Message]:
+        if self.uow.writing:
+            return await self.repository.get_all(offset, limit)
+
+        async def load() -> list[list]:
+            return [
+                _dump(message)
+                for message in await self.repository.get_all(offset, limit)
+            ]
+
+        rows = await self.cache.get_or_load(
+            LISTS_KEY,
+            f"offset:{offset}:{limit}",
+            load,
+        )
+        return [_load(row) for row in rows]
+
+    async def get_after(
+        self,
+        after_id: int | None = None,
+        limit: int = 20,
+    ) -> list[Message]:
+        if self.uow.writing:
+            return await self.repository.get_after(after_id, limit)
+
+        async def load() -> list[list]:
+            return [
+                _dump(message)
+                for message in await self.repository.get_after(after_id, limit)
+            ]
+
+        rows = await self.cache.get_or_load(
+            LISTS_KEY,
+            f"after:{after_id}:{limit}",
+            load,
+        )
+        return [_load(row) for row in rows]
+
+    async def create(self, msg_data: MessageCreate) -> Message:
+        message = await self.repository.create(msg_data)
+        # A lookup of this id before it existed may have cached a miss.
+        self._invalidate_after_commit(_message_key(message.id), LISTS_KEY)
+        return message
+
+    async def update(
+        self,
+        msg_id: int,
+        msg_data: MessageUpdate,
+    ) -> Message | None:
+        message = await self.repository.update(msg_id, msg_data)
+        if message is not None:
+            self._invalidate_after_commit(_message_key(msg_id), LISTS_KEY)
+        return message
+
+    async def delete(self, msg_id: int) -> bool:
+        deleted = await self.repository.delete(msg_id)
+        if deleted:
+            self._invalidate_after_commit(_message_key(msg_id), LISTS_KEY)
+        return deleted
+
+    def _invalidate_after_commit(self, *keys: str) -> None:
+        async def invalidate() -> None:
+            await self.cache.invalidate(*keys)
+
+        self.uow.on_commit(invalidate)
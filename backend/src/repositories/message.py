@@ -1,8 +1,9 @@
 from typing import Protocol
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import delete, select, update
 
+from core.metrics import instrument_repository
 from models import Message
 from schemas.message import MessageCreate, MessageUpdate
 
@@ -14,6 +15,12 @@ class MessageRepositoryI(Protocol):
         self, offset: int = 0, limit: int = 20
     ) -> list[Message] | None: ...
 
+    async def get_after(
+        self,
+        after_id: int | None = None,
+        limit: int = 20,
+    ) -> list[Message]: ...
+
     async def create(self, msg_data: MessageCreate) -> Message: ...
 
     async def update(
@@ -25,6 +32,7 @@ class MessageRepositoryI(Protocol):
     async def delete(self, msg_id: int) -> bool: ...
 
 
+@instrument_repository
 class MessageRepository(MessageRepositoryI):
     def __init__(
         self,
@@ -42,7 +50,20 @@ class MessageRepository(MessageRepositoryI):
         offset: int = 0,
         limit: int = 20,
     ) -> list[Message]:
-        query = select(Message).offset(offset).limit(limit)
+        query = (
+            select(Message).order_by(Message.id).offset(offset).limit(limit)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def get_after(
+        self,
+        after_id: int | None = None,
+        limit: int = 20,
+    ) -> list[Message]:
+        query = select(Message).order_by(Message.id).limit(limit)
+        if after_id is not None:
+            query = query.where(Message.id > after_id)
         result = await self.session.execute(query)
         return result.scalars().all()
 
@@ -57,21 +78,21 @@ class MessageRepository(MessageRepositoryI):
         msg_id: int,
         msg_data: MessageUpdate,
     ) -> Message | None:
-        messaage = await self.get(msg_id)
-        if not messaage:
-            return None
-        updated_data = msg_data.model_dump(exclude_unset=True)
-        for field, value in updated_data.items():
-            setattr(messaage, field, value)
-        self.session.add(messaage)
-        return messaage
+        stmt = (
+            update(Message)
+            .where(Message.id == msg_id)
+            .values(**msg_data.model_dump(exclude_unset=True))
+            .returning(Message)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def delete(self, msg_id: int) -> bool:
-        message = await self.session.get(Message, msg_id)
-        if not message:
-            return False
-
-        stmt = delete(Message).where(Message.id == msg_id)
-        await self.session.execute(stmt)
-        await self.session.flush()
-        return True
+        stmt = (
+            delete(Message)
+            .where(Message.id == msg_id)
+            .returning(Message.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
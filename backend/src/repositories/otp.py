@@ -0,0 +1,97 @@
+from typing import Protocol
+
+from redis.asyncio import Redis
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.metrics import instrument_repository
+from models import User
+
+# Counts the attempt and hands back the secret only while attempts remain,
+# so a code cannot be brute-forced within its TTL. Exhausting them drops
+# the secret and the user has to log in again.
+_USE_ATTEMPT = """
+local secret = redis.call('HGET', KEYS[1], 'secret')
+if not secret then
+    return false
+end
+if redis.call('HINCRBY', KEYS[1], 'attempts', 1) > tonumber(ARGV[1]) then
+    redis.call('DEL', KEYS[1])
+    return false
+end
+return secret
+"""
+
+
+class OTPRepositoryI(Protocol):
+    async def save(self, user_id: int, otp_secret: str) -> None: ...
+
+    async def get(self, user_id: int) -> str | None: ...
+
+    async def use_attempt(self, user_id: int) -> str | None: ...
+
+    async def delete(self, user_id: int) -> None: ...
+
+
+class RedisOTPRepository(OTPRepositoryI):
+    key_prefix = "otp"
+
+    def __init__(self, redis: Redis, ttl: int, max_attempts: int):
+        self.redis = redis
+        self.ttl = ttl
+        self.max_attempts = max_attempts
+        self._use_attempt = redis.register_script(_USE_ATTEMPT)
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    async def save(self, user_id: int, otp_secret: str) -> None:
+        key = self._key(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, "secret", otp_secret)
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+    async def get(self, user_id: int) -> str | None:
+        secret = await self.redis.hget(self._key(user_id), "secret")
+        return secret.decode() if secret is not None else None
+
+    async def use_attempt(self, user_id: int) -> str | None:
+        secret = await self._use_attempt(
+            keys=[self._key(user_id)],
+            args=[self.max_attempts],
+        )
+        return secret.decode() if secret is not None else None
+
+    async def delete(self, user_id: int) -> None:
+        await self.redis.delete(self._key(user_id))
+
+
+@instrument_repository
+class DatabaseOTPRepository(OTPRepositoryI):
+    # Fallback for deployments without Redis: the secret lives in
+    # users.otp_secret and expires with the TOTP interval. Attempts are
+    # not counted, so keep the rate limit on /check-code in place.
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save(self, user_id: int, otp_secret: str) -> None:
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(otp_secret=otp_secret)
+        )
+        await self.session.execute(stmt)
+
+    async def get(self, user_id: int) -> str | None:
+        query = select(User.otp_secret).where(User.id == user_id)
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def use_attempt(self, user_id: int) -> str | None:
+        return await self.get(user_id)
+
+    async def delete(self, user_id: int) -> None:
+        stmt = update(User).where(User.id == user_id).values(otp_secret=None)
+        await self.session.execute(stmt)
@@ -0,0 +1,67 @@
+from datetime import timedelta
+from typing import Any, Protocol
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.metrics import instrument_repository
+from models import OutboxMessage
+
+
+class OutboxRepositoryI(Protocol):
+    async def add(self, task_name: str, kwargs: dict[str, Any]) -> None: ...
+
+    async def claim_batch(self, limit: int) -> list[OutboxMessage]: ...
+
+    async def delete(self, message_ids: list[int]) -> None: ...
+
+    async def record_failure(
+        self,
+        message: OutboxMessage,
+        retry_in: float | None,
+    ) -> None: ...
+
+
+@instrument_repository
+class OutboxRepository(OutboxRepositoryI):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, task_name: str, kwargs: dict[str, Any]) -> None:
+        self.session.add(OutboxMessage(task_name=task_name, kwargs=kwargs))
+        await self.session.flush()
+
+    async def claim_batch(self, limit: int) -> list[OutboxMessage]:
+        # SKIP LOCKED lets every app process run a publisher without two
+        # of them claiming the same rows. Rows backing off and dead
+        # letters are left out, so a message that keeps failing cannot
+        # hold the head of every batch.
+        query = (
+            select(OutboxMessage)
+            .where(
+                OutboxMessage.dead_at.is_(None),
+                OutboxMessage.next_attempt_at <= func.now(),
+            )
+            .order_by(OutboxMessage.next_attempt_at, OutboxMessage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def delete(self, message_ids: list[int]) -> None:
+        stmt = delete(OutboxMessage).where(OutboxMessage.id.in_(message_ids))
+        await self.session.execute(stmt)
+
+    async def record_failure(
+        self,
+        message: OutboxMessage,
+        retry_in: float | None,
+    ) -> None:
+        # The row is locked by claim_batch, so the plain increment is safe.
+        message.attempts += 1
+        if retry_in is None:
+            message.dead_at = func.now()
+        else:
+            message.next_attempt_at = func.now() + timedelta(seconds=retry_in)
+        await self.session.flush()
@@ -1,8 +1,10 @@
 from typing import Protocol
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.metrics import instrument_repository
 from models import User
 from models.user import RoleEnum
 from schemas.user import UserCreate, UserUpdate, UserCreateConsole
@@ -14,6 +16,11 @@ class IUserRepository(Protocol):
         user_data: UserCreate | UserCreateConsole,
     ) -> User: ...
 
+    async def create_if_absent(
+        self,
+        user_data: UserCreate | UserCreateConsole,
+    ) -> User | None: ...
+
     async def get(self, user_id: int) -> User: ...
 
     async def get_user_by_email_token(self, token: str) -> User | None: ...
@@ -24,17 +31,24 @@ class IUserRepository(Protocol):
         limit: int = 20,
     ) -> list[User]: ...
 
-    async def update(self, user_data: UserUpdate) -> User: ...
-
-    async def get_user_by_email(self, email: str) -> User | None: ...
+    async def get_after(
+        self,
+        after_id: int | None = None,
+        limit: int = 20,
+    ) -> list[User]: ...
 
-    async def set_is_verify_user(self, user: User) -> bool: ...
+    async def update(
+        self,
+        user_id: int,
+        user_data: UserUpdate,
+    ) -> User | None: ...
 
-    async def set_otp_secret(self, user: User, otp_secret: str | None): ...
+    async def get_user_by_email(self, email: str) -> User | None: ...
 
-    async def get_otp_secret(self, user: User) -> str | None: ...
+    async def verify_email(self, token: str) -> User | None: ...
 
 
+@instrument_repository
 class UserRepository(IUserRepository):
     def __init__(
         self,
@@ -52,6 +66,21 @@ class UserRepository(IUserRepository):
         await self.session.flush()
         return user
 
+    async def create_if_absent(
+        self,
+        user_data: UserCreate | UserCreateConsole,
+    ) -> User | None:
+        values = user_data.model_dump()
+        values.setdefault("role", RoleEnum.USER)
+        stmt = (
+            insert(User)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get(self, user_id: int) -> User | None:
         query = select(User).where(User.id == user_id)
         result = await self.session.execute(query)
@@ -62,19 +91,37 @@ class UserRepository(IUserRepository):
         offset: int = 0,
         limit: int = 20,
     ) -> list[User] | None:
-        query = select(User).offset(offset).limit(limit)
+        query = select(User).order_by(User.id).offset(offset).limit(limit)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def get_after(
+        self,
+        after_id: int | None = None,
+        limit: int = 20,
+    ) -> list[User]:
+        query = select(User).order_by(User.id).limit(limit)
+        if after_id is not None:
+            query = query.where(User.id > after_id)
         result = await self.session.execute(query)
         return result.scalars().all()
 
     async def update(self, user_id: int, user_data: UserUpdate) -> User | None:
-        user = await self.get(user_id)
-        if not user:
-            return None
         updated_data = user_data.model_dump(exclude_unset=True)
-        for field, value in updated_data.items():
-            setattr(user, field, value)
-        self.session.add(user)
-        return user
+        if not updated_data:
+            return await self.get(user_id)
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                **updated_data,
+                token_version=User.token_version + 1,
+            )
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def get_user_by_email(self, email: str) -> User | None:
         query = select(User).where(User.email == email)
@@ -86,17 +133,13 @@ class UserRepository(IUserRepository):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
-    async def set_is_verify_user(self, user: User, token: str) -> User:
-        user.email_verified = True
-        self.session.add(user)
-        return user
-
-    async def set_otp_secret(self, user: User, otp_secret: str | None):
-        user.otp_secret = otp_secret
-        self.session.add(user)
-        return user
-
-    async def get_otp_secret(self, user: User) -> str | None:
-        query = select(User.otp_secret).where(User.id == user.id)
-        result = await self.session.execute(query)
+    async def verify_email(self, token: str) -> User | None:
+        stmt = (
+            update(User)
+            .where(User.token == token)
+            .values(email_verified=True)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
@@ -1,6 +1,7 @@
 from routers.dev_router import router as dev_router
 from routers.user_router import router as user_router
 from routers.message_router import router as message_router
+from routers.metrics_router import router as metrics_router
 from routers.root_router import root_router
 
 __all__ = [
@@ -8,4 +9,5 @@ __all__ = [
     "user_router",
     "root_router",
     "message_router",
+    "metrics_router",
 ]
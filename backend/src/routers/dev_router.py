@@ -1,7 +1,5 @@
-from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Request
-
-from core.rate_limiter import RateLimiter, Strategy, rate_limit
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter
 
 router = APIRouter(
     prefix="",
@@ -11,9 +9,5 @@ router = APIRouter(
 
 
 @router.get("/ping")
-@rate_limit(strategy=Strategy.IP, policy="30/s;200/m;3000/h")
-async def pong(
-    request: Request,
-    rate_limiter: FromDishka[RateLimiter],
-):
+async def pong():
     return {"message": "pong"}
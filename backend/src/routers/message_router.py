@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Request, Response, HTTPException, status
+from fastapi import APIRouter, Query, Request, Response, HTTPException, status
 from dishka.integrations.fastapi import FromDishka, DishkaRoute
 
 from services import MessageService
 from schemas.message import MessageCreate, MessageUpdate, MessageResponse
+from utils.pagination import NEXT_CURSOR_HEADER
+from utils.responses import trusted_json, trusted_rows
 
 
 router = APIRouter(
@@ -36,7 +38,8 @@ async def get_msg(
     service: FromDishka[MessageService],
 ):
     try:
-        return await service.get_msg(msg_id)
+        message = await service.get_msg(msg_id)
+        return trusted_json(message, response)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -49,9 +52,18 @@ async def get_all_msg(
     response: Response,
     request: Request,
     service: FromDishka[MessageService],
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
 ):
     try:
-        return await service.get_all_msgs()
+        page = await service.get_all_msgs(offset, limit, cursor)
+        if page.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        return trusted_json(
+            trusted_rows(MessageResponse, page.items),
+            response,
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,25 @@
+import os
+
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+router = APIRouter(tags=["Metrics"])
+
+# With several uvicorn workers each process writes its samples to
+# PROMETHEUS_MULTIPROC_DIR and the scrape aggregates the whole directory.
+if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+else:
+    registry = REGISTRY
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
@@ -1,7 +1,6 @@
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, HTTPException, Request, status, Response
+from fastapi import APIRouter, HTTPException, Query, Request, status, Response
 
-from core.rate_limiter import RateLimiter, Strategy, rate_limit
 from schemas.user import (
     OTPCode,
     UserCreate,
@@ -12,6 +11,8 @@ from schemas.user import (
 )
 from services import UserService
 from entrypoint.config import Config
+from utils.pagination import NEXT_CURSOR_HEADER
+from utils.responses import trusted_json, trusted_rows
 
 router = APIRouter(
     prefix="/users",
@@ -21,12 +22,10 @@ router = APIRouter(
 
 
 @router.post("/register", response_model=UserResponse)
-@rate_limit(strategy=Strategy.IP, policy="3/m;10/h;20/d")
 async def register(
     request: Request,
     response: Response,
     user_data: UserCreate,
-    rate_limiter: FromDishka[RateLimiter],
     service: FromDishka[UserService],
 ):
     try:
@@ -40,12 +39,10 @@ async def register(
 
 
 @router.get("/verify-email")
-@rate_limit(strategy=Strategy.IP, policy="5/m;20/h")
 async def verify_email(
     request: Request,
     response: Response,
     token: str,
-    rate_limiter: FromDishka[RateLimiter],
     service: FromDishka[UserService],
 ):
     try:
@@ -58,12 +55,10 @@ async def verify_email(
 
 
 @router.post("/check-code")
-@rate_limit(strategy=Strategy.IP, policy="5/m;20/h")
 async def check_code(
     request: Request,
     response: Response,
     code: OTPCode,
-    rate_limiter: FromDishka[RateLimiter],
     config: FromDishka[Config],
     service: FromDishka[UserService],
     current_user: FromDishka[UserResponse],
@@ -97,11 +92,9 @@ async def check_code(
 
 
 @router.post("/resend-otp")
-@rate_limit(strategy=Strategy.IP, policy="2/m;5/h")
 async def resend_otp(
     request: Request,
     response: Response,
-    rate_limiter: FromDishka[RateLimiter],
     service: FromDishka[UserService],
     current_user: FromDishka[UserResponse],
 ):
@@ -114,13 +107,11 @@ async def resend_otp(
         )
 
 
-@rate_limit(strategy=Strategy.IP, policy="5/m;20/h;50/d")
 @router.post("/login", response_model=AccessToken)
 async def login(
     request: Request,
     response: Response,
     user_data: UserLogin,
-    rate_limiter: FromDishka[RateLimiter],
     service: FromDishka[UserService],
     config: FromDishka[Config],
 ):
@@ -148,16 +139,14 @@ async def login(
 async def get_profile(
     current_user: FromDishka[UserResponse],
 ):
-    return current_user
+    return trusted_json(current_user)
 
 
 @router.post("/refresh")
-@rate_limit(strategy=Strategy.IP, policy="10/m;100/h")
 async def refresh_token(
     request: Request,
     response: Response,
     config: FromDishka[Config],
-    rate_limiter: FromDishka[RateLimiter],
     service: FromDishka[UserService],
 ):
     try:
@@ -214,11 +203,26 @@ async def update_profile(
 
 @router.get("/", response_model=list[UserResponse])
 async def get_all_users(
+    response: Response,
     service: FromDishka[UserService],
     current_user: FromDishka[UserResponse],
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
 ):
     try:
-        return await service.get_all_users(current_user)
+        page = await service.get_all_users(
+            current_user,
+            offset,
+            limit,
+            cursor,
+        )
+        if page.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        return trusted_json(
+            trusted_rows(UserResponse, page.items),
+            response,
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -233,7 +237,8 @@ async def get_user_by_id(
     current_user: FromDishka[UserResponse],
 ):
     try:
-        return await service.get_user(user_id, current_user)
+        user = await service.get_user(user_id, current_user)
+        return trusted_json(user)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -9,7 +9,7 @@ from entrypoint.setup import (
     create_app,
     create_async_container,
 )
-from routers import root_router
+from routers import metrics_router, root_router
 
 
 def make_app(*di_providers: Provider) -> FastAPI:
@@ -17,7 +17,11 @@ def make_app(*di_providers: Provider) -> FastAPI:
 
     configure_middlewares(app=app)
 
-    configure_app(app=app, root_router=root_router)
+    configure_app(
+        app=app,
+        root_router=root_router,
+        metrics_router=metrics_router,
+    )
 
     providers = get_providers()
 
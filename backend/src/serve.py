@@ -0,0 +1,130 @@
+import argparse
+import logging
+import math
+import os
+import shutil
+import tempfile
+from importlib.util import find_spec
+from pathlib import Path
+
+import uvicorn
+
+from entrypoint.config import config
+
+logger = logging.getLogger(__name__)
+
+TASKS_PATTERN = "**/tasks/*.py"
+
+
+def available_cpus() -> int:
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    # A container's CPU limit is a CFS quota, not a smaller set of CPUs,
+    # so os.cpu_count() reports every CPU of the host.
+    quota = cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, max(1, math.ceil(quota)))
+    return cpus
+
+
+def cgroup_cpu_quota() -> float | None:
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+    except (OSError, ValueError):
+        try:
+            quota = Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text()
+            period = Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text()
+        except OSError:
+            return None
+    if quota.strip() in ("max", "-1"):
+        return None
+    return int(quota) / int(period)
+
+
+def prepare_metrics_dir() -> None:
+    # Every worker writes its samples into this directory. Files left by
+    # a previous run would be summed into the new one, so start empty.
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path is None:
+        path = tempfile.mkdtemp(prefix="prometheus-")
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def serve_api() -> None:
+    workers = config.app.WORKERS or available_cpus()
+    if workers > 1:
+        prepare_metrics_dir()
+
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+    logger.info("Starting %d API workers (%s, %s)", workers, loop, http)
+
+    # Workers are spawned processes that import run.make_app themselves,
+    # so the engine, Redis pool and broker connection are created per
+    # worker and nothing opened here is shared across them.
+    uvicorn.run(
+        "run:make_app",
+        factory=True,
+        host=config.app.HOST,
+        port=config.app.PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        backlog=config.app.BACKLOG,
+        timeout_keep_alive=config.app.KEEPALIVE_TIMEOUT,
+        timeout_graceful_shutdown=config.app.GRACEFUL_TIMEOUT,
+    )
+
+
+def serve_worker() -> None:
+    processes = config.worker.PROCESSES or available_cpus()
+    args = [
+        "taskiq",
+        "worker",
+        "core:broker",
+        "--workers",
+        str(processes),
+        "--max-async-tasks",
+        str(config.worker.MAX_ASYNC_TASKS),
+        "--max-prefetch",
+        str(config.worker.PREFETCH),
+        "--shutdown-timeout",
+        str(config.worker.SHUTDOWN_TIMEOUT),
+        "--fs-discover",
+        "--tasks-pattern",
+        TASKS_PATTERN,
+    ]
+    logger.info("Starting %d task worker processes", processes)
+    os.execvp(args[0], args)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Run the API server or the task worker",
+    )
+    parser.add_argument(
+        "target",
+        nargs="?",
+        choices=("api", "worker"),
+        default="api",
+    )
+    return parser.parse_args()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    if args.target == "worker":
+        serve_worker()
+    else:
+        serve_api()
+
+
+if __name__ == "__main__":
+    main()
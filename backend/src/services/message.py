@@ -1,8 +1,10 @@
 from fastapi import HTTPException, status
 
 from core.uow import UnitOfWork
+from models import Message
 from repositories import MessageRepositoryI
 from schemas.message import MessageCreate, MessageUpdate, MessageResponse
+from utils.pagination import Page, decode_cursor, make_page
 
 
 class MessageService:
@@ -27,7 +29,8 @@ class MessageService:
             return MessageResponse(id=message.id, content=message.content)
 
     async def get_msg(self, msg_id: int) -> MessageResponse:
-        msg = await self.message_repository.get(msg_id)
+        async with self.uow.read():
+            msg = await self.message_repository.get(msg_id)
         if not msg:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -38,36 +41,49 @@ class MessageService:
             content=msg.content,
         )
 
-    async def get_all_msgs(self):
-        messages = await self.message_repository.get_all()
-        if not messages:
+    async def get_all_msgs(
+        self,
+        offset: int = 0,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> Page[Message]:
+        async with self.uow.read():
+            if cursor is not None:
+                messages = await self.message_repository.get_after(
+                    decode_cursor(cursor),
+                    limit,
+                )
+            else:
+                messages = await self.message_repository.get_all(
+                    offset,
+                    limit,
+                )
+        if not messages and cursor is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Messages not found.",
             )
-        return messages
+        return make_page(messages, limit)
 
     async def update_msg(self, msg_id: int, msg_data: MessageUpdate):
-        message = await self.message_repository.get(msg_id)
-        if not message:
-            raise HTTPException(
-                status_code=status.H404,
-                detail="Messages not found.",
-            )
         async with self.uow:
             updated_msg = await self.message_repository.update(
                 msg_id,
                 msg_data,
             )
-            return updated_msg
-
-    async def delete_msg(self, msg_id: int) -> bool:
-        message = await self.message_repository.get(msg_id)
-        if not message:
+        if not updated_msg:
             raise HTTPException(
-                status_code=status.H404,
+                status_code=status.HTTP_404_NOT_FOUND,
                 detail="Messages not found.",
             )
+        return updated_msg
+
+    async def delete_msg(self, msg_id: int) -> bool:
         async with self.uow:
             delete_succses = await self.message_repository.delete(msg_id)
-            return delete_succses
+        if not delete_succses:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Messages not found.",
+            )
+        return delete_succses
@@ -1,9 +1,18 @@
+import asyncio
+import logging
 import re
 
+from redis.exceptions import RedisError
+
+from core.outbox import Outbox
+from core.password_hasher import PasswordHasher
 from core.permissions import require_roles
+from core.token_cache import TokenCache
+from core.token_version import TokenVersionStore
 from core.uow import UnitOfWork
-from models import RoleEnum
-from repositories import IUserRepository
+from entrypoint.config import config
+from models import RoleEnum, User
+from repositories import IUserRepository, OTPRepositoryI
 from schemas.user import (
     AccessToken,
     OTPCode,
@@ -19,8 +28,6 @@ from utils.jwt_utils import (
     create_access_token,
     create_refresh_token,
     decode_jwt,
-    hash_password,
-    validate_password,
 )
 from utils.otp_utils import (
     generate_otp_code,
@@ -28,6 +35,9 @@ from utils.otp_utils import (
     verify_otp_code,
 )
 from tasks.email import send_otp_code, send_verify_email
+from utils.pagination import Page, decode_cursor, make_page
+
+logger = logging.getLogger(__name__)
 
 
 class UserService:
@@ -35,31 +45,87 @@ class UserService:
         self,
         uow: UnitOfWork,
         user_repository: IUserRepository,
+        password_hasher: PasswordHasher,
+        token_cache: TokenCache,
+        token_versions: TokenVersionStore,
+        otp_repository: OTPRepositoryI,
+        outbox: Outbox,
     ):
         self.uow = uow
         self.user_repository = user_repository
+        self.otp_repository = otp_repository
+        self.outbox = outbox
+        self.password_hasher = password_hasher
+        self.token_cache = token_cache
+        self.token_versions = token_versions
+
+    async def _create_access_token(
+        self,
+        user: User,
+        expire_minutes: int = config.auth_jwt.ACCESS_TOKEN_EXPIRE_MINUTES,
+    ) -> str:
+        data = {"sub": str(user.id)}
+        if config.auth_jwt.STATELESS:
+            # Lets get_current_user rebuild the user without a DB lookup
+            # for as long as "ver" matches users.token_version.
+            data.update(
+                email=user.email,
+                username=user.username,
+                role=user.role,
+                ver=user.token_version,
+            )
+        return create_access_token(data, expire_minutes)
+
+    async def _hash_new_user_password(
+        self,
+        email: str,
+        password: str,
+        duplicate_message: str,
+    ) -> str:
+        # bcrypt runs while the probe is in flight and is abandoned as soon
+        # as the email turns out to be taken. The probe is only a shortcut:
+        # create_if_absent is what actually guards against duplicates.
+        hashing = asyncio.ensure_future(self.password_hasher.hash(password))
+        try:
+            async with self.uow.read():
+                existing_user = await self.user_repository.get_user_by_email(
+                    email,
+                )
+            if existing_user is not None:
+                raise ValueError(duplicate_message)
+        except BaseException:
+            hashing.cancel()
+            hashing.add_done_callback(
+                lambda task: task.cancelled() or task.exception(),
+            )
+            raise
+        return await hashing
 
     async def register_user(self, user_data: UserCreate) -> UserResponse:
         self._validate_password(user_data.password, RoleEnum.USER)
 
-        existing_user = await self.user_repository.get_user_by_email(
+        hashed_password = await self._hash_new_user_password(
             user_data.email,
+            user_data.password,
+            "Email already exists",
         )
-        if existing_user is not None:
-            raise ValueError("Email already exists")
 
         async with self.uow:
-            hashed_password = hash_password(user_data.password)
             user_create_data = UserCreate(
                 email=user_data.email,
                 username=user_data.username,
                 password=hashed_password,
             )
-            user = await self.user_repository.create(user_create_data)
+            user = await self.user_repository.create_if_absent(
+                user_create_data,
+            )
+            if user is None:
+                raise ValueError("Email already exists")
 
-            await send_verify_email.kiq(
+            await self.outbox.enqueue(
+                send_verify_email,
                 to_email=user.email,
-                token=user.token,
+                token=str(user.token),
             )
 
             return UserResponse(
@@ -74,32 +140,44 @@ class UserService:
         user: UserResponse,
         otp_code: OTPCode,
     ) -> TokenPair:
-        otp_secret = await self.user_repository.get_otp_secret(user)
+        async with self.uow.read():
+            otp_secret = await self.otp_repository.use_attempt(user.id)
 
-        if not verify_otp_code(otp_code.otp_code, otp_secret):
+        if not otp_secret or not verify_otp_code(
+            otp_code.otp_code,
+            otp_secret,
+        ):
             raise ValueError("Not valid code")
 
+        async with self.uow.read():
+            user = await self.user_repository.get(user.id)
+        if not user:
+            raise LookupError("User not found")
+
+        async with self.uow:
+            await self.otp_repository.delete(user.id)
+
         tokens = TokenPair(
-            access_token=create_access_token({"sub": str(user.id)}),
+            access_token=await self._create_access_token(user),
             refresh_token=create_refresh_token({"sub": str(user.id)}),
         )
         return tokens
 
     async def verify_email(self, token: str) -> bool:
-        user = await self.user_repository.get_user_by_email_token(token)
+        async with self.uow:
+            user = await self.user_repository.verify_email(token)
         if user is None:
             raise ValueError("User not found")
-        async with self.uow:
-            await self.user_repository.set_is_verify_user(user, token)
-            return True
+        return True
 
     async def resend_otp_code(self, user: UserResponse) -> bool:
-        otp_secret = await self.user_repository.get_otp_secret(user)
+        async with self.uow.read():
+            otp_secret = await self.otp_repository.get(user.id)
 
         if not otp_secret:
             otp_secret = generate_otp_secret()
             async with self.uow:
-                await self.user_repository.set_otp_secret(user, otp_secret)
+                await self.otp_repository.save(user.id, otp_secret)
 
         otp_code = generate_otp_code(otp_secret)
 
@@ -110,8 +188,11 @@ class UserService:
         return True
 
     async def login_user(self, user_data: UserLogin) -> AccessToken:
-        user = await self.user_repository.get_user_by_email(user_data.email)
-        if user is None or not validate_password(
+        async with self.uow.read():
+            user = await self.user_repository.get_user_by_email(
+                user_data.email,
+            )
+        if user is None or not await self.password_hasher.verify(
             user_data.password,
             user.password,
         ):
@@ -123,7 +204,7 @@ class UserService:
         otp_code = generate_otp_code(otp_secret)
 
         async with self.uow:
-            await self.user_repository.set_otp_secret(user, otp_secret)
+            await self.otp_repository.save(user.id, otp_secret)
 
         await send_otp_code.kiq(
             to_email=user.email,
@@ -131,7 +212,7 @@ class UserService:
         )
 
         token = AccessToken(
-            access_token=create_access_token({"sub": str(user.id)}, 5),
+            access_token=await self._create_access_token(user, 5),
         )
         return token
 
@@ -144,14 +225,30 @@ class UserService:
     ) -> UserResponse:
         update_data = user_update.model_dump(exclude_unset=True)
         if "password" in update_data and update_data["password"]:
-            update_data["password"] = hash_password(update_data["password"])
+            update_data["password"] = await self.password_hasher.hash(
+                update_data["password"],
+            )
 
-        updated = await self.user_repository.update(
-            user_id,
-            UserUpdate(**update_data),
-        )
+        async with self.uow:
+            updated = await self.user_repository.update(
+                user_id,
+                UserUpdate(**update_data),
+            )
         if not updated:
             raise LookupError("User not found")
+
+        self.token_cache.invalidate_user(user_id)
+        # Other workers drop their cached tokens for this user once they
+        # see the new version. It is already committed; if Redis misses
+        # it, the next database fallback re-seeds it from the row.
+        try:
+            await self.token_versions.set(user_id, updated.token_version)
+        except (RedisError, OSError) as exc:
+            logger.warning(
+                "Caching token version of user %s failed: %r",
+                user_id,
+                exc,
+            )
         return UserResponse(
             id=updated.id,
             email=updated.email,
@@ -165,7 +262,8 @@ class UserService:
         user_id: int,
         current_user,
     ) -> UserResponse:
-        user = await self.user_repository.get(user_id)
+        async with self.uow.read():
+            user = await self.user_repository.get(user_id)
         if not user:
             raise ValueError("User not found")
         user_repsonse = UserResponse(
@@ -177,7 +275,8 @@ class UserService:
         return user_repsonse
 
     async def get_user_by_id(self, user_id: int):
-        user = await self.user_repository.get(user_id)
+        async with self.uow.read():
+            user = await self.user_repository.get(user_id)
         return user
 
     @require_roles([RoleEnum.ADMIN])
@@ -186,11 +285,19 @@ class UserService:
         user: UserResponse,
         offset: int = 0,
         limit: int = 20,
-    ):
-        users = await self.user_repository.get_all(offset, limit)
-        if not users:
+        cursor: str | None = None,
+    ) -> Page[User]:
+        async with self.uow.read():
+            if cursor is not None:
+                users = await self.user_repository.get_after(
+                    decode_cursor(cursor),
+                    limit,
+                )
+            else:
+                users = await self.user_repository.get_all(offset, limit)
+        if not users and cursor is None:
             raise ValueError("Not a single user was found")
-        return users
+        return make_page(users, limit)
 
     async def refresh_token(
         self,
@@ -205,12 +312,13 @@ class UserService:
         print(f"User id = {user_id}")
         if not user_id:
             raise ValueError("Invalid token payload")
-        user = await self.user_repository.get(user_id)
+        async with self.uow.read():
+            user = await self.user_repository.get(user_id)
         print(f"User = {user}")
         if not user:
             raise LookupError("User not found")
         return TokenPair(
-            access_token=create_access_token({"sub": str(user.id)}),
+            access_token=await self._create_access_token(user),
             refresh_token=create_refresh_token({"sub": str(user.id)}),
         )
 
@@ -220,7 +328,8 @@ class UserService:
             user_id = int(payload.get("sub"))
             if not user_id:
                 return None
-            user = await self.user_repository.get(user_id)
+            async with self.uow.read():
+                user = await self.user_repository.get(user_id)
             if not user:
                 return None
 
@@ -247,21 +356,24 @@ class UserService:
 
         self._validate_password(user_data.password, user_role)
 
-        existing_user = await self.user_repository.get_user_by_email(
+        hashed_password = await self._hash_new_user_password(
             user_data.email,
+            user_data.password,
+            "User with this email already exists",
         )
-        if existing_user is not None:
-            raise ValueError("User with this email already exists")
 
         async with self.uow:
-            hashed_password = hash_password(user_data.password)
             user_create_data = UserCreateConsole(
                 email=user_data.email,
                 username=user_data.username,
                 password=hashed_password,
                 role=user_role,
             )
-            user = await self.user_repository.create(user_create_data)
+            user = await self.user_repository.create_if_absent(
+                user_create_data,
+            )
+            if user is None:
+                raise ValueError("User with this email already exists")
             return UserResponse(
                 id=user.id,
                 email=user.email,
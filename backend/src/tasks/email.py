@@ -1,16 +1,36 @@
 import logging
 from email.message import EmailMessage
 
-import aiosmtplib
+from taskiq import Context, TaskiqDepends, TaskiqEvents, TaskiqState
 
+from clients import SMTPPool
 from core import broker
 from entrypoint.config import Config, config
 
 logger = logging.getLogger(__name__)
 
 
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def open_smtp_pool(state: TaskiqState):
+    state.smtp_pool = SMTPPool.from_config(config.email)
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def close_smtp_pool(state: TaskiqState):
+    await state.smtp_pool.close()
+
+
+def get_smtp_pool(context: Context = TaskiqDepends()) -> SMTPPool:
+    return context.state.smtp_pool
+
+
 @broker.task(task_name="send_verify_email")
-async def send_verify_email(to_email: str, token, config: Config = config):
+async def send_verify_email(
+    to_email: str,
+    token,
+    config: Config = config,
+    smtp_pool: SMTPPool = TaskiqDepends(get_smtp_pool),
+):
     message = EmailMessage()
     message["From"] = config.email.USERNAME
     message["To"] = to_email
@@ -18,21 +38,16 @@ async def send_verify_email(to_email: str, token, config: Config = config):
     verify_link = config.frontend.URL + f"/verify-email?{token}"
     message.set_content(f"Для активации перейдите по ссылке:\n\n{verify_link}")
 
-    await aiosmtplib.send(
-        message,
-        sender=config.email.USERNAME,
-        hostname=config.email.HOST,
-        port=config.email.PORT,
-        username=config.email.USERNAME,
-        password=config.email.PASSWORD,
-        use_tls=True,
-        timeout=60,
-        tls_context=None,
-    )
+    await smtp_pool.send(message)
 
 
 @broker.task(task_name="send_otp_code")
-async def send_otp_code(to_email: str, otp_code: str, config: Config = config):
+async def send_otp_code(
+    to_email: str,
+    otp_code: str,
+    config: Config = config,
+    smtp_pool: SMTPPool = TaskiqDepends(get_smtp_pool),
+):
     message = EmailMessage()
     message["From"] = config.email.USERNAME
     message["To"] = to_email
@@ -40,14 +55,4 @@ async def send_otp_code(to_email: str, otp_code: str, config: Config = config):
     body = f"Ваш код для входа:\n\n{otp_code}\n\nКод действует 5 минут."
     message.set_content(body)
 
-    await aiosmtplib.send(
-        message,
-        sender=config.email.USERNAME,
-        hostname=config.email.HOST,
-        port=config.email.PORT,
-        username=config.email.USERNAME,
-        password=config.email.PASSWORD,
-        use_tls=True,
-        timeout=60,
-        tls_context=None,
-    )
+    await smtp_pool.send(message)
@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+from jwt import InvalidTokenError
+
+from entrypoint.config import AuthJWT
+
+SUPPORTED_ALGORITHMS = ("RS256", "ES256", "EdDSA")
+
+
+def algorithm_for_key(key) -> str:
+    if isinstance(key, (rsa.RSAPrivateKey, rsa.RSAPublicKey)):
+        return "RS256"
+    if isinstance(
+        key,
+        (ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey),
+    ):
+        if not isinstance(key.curve, ec.SECP256R1):
+            raise ValueError(f"Unsupported EC curve: {key.curve.name}")
+        return "ES256"
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+        return "EdDSA"
+    raise ValueError(f"Unsupported key type: {type(key).__name__}")
+
+
+class JWTKeyManager:
+    def __init__(
+        self,
+        private_key,
+        public_key,
+        algorithm: str,
+        key_id: str | None = None,
+        verification_keys: dict[str, object] | None = None,
+    ):
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            raise ValueError(
+                f"Unsupported JWT algorithm: {algorithm}.",
+                f"Expected one of: {', '.join(SUPPORTED_ALGORITHMS)}",
+            )
+        if algorithm_for_key(private_key) != algorithm:
+            raise ValueError(
+                f"Private key does not match JWT algorithm {algorithm}",
+            )
+
+        self._private_key = private_key
+        self._algorithm = algorithm
+        self._headers = {"kid": key_id} if key_id else None
+
+        # Tokens without a kid were issued before rotation was configured
+        # and are checked against the current key.
+        self._verification_keys = {None: (algorithm, public_key)}
+        if key_id:
+            self._verification_keys[key_id] = (algorithm, public_key)
+        for kid, key in (verification_keys or {}).items():
+            self._verification_keys.setdefault(
+                kid,
+                (algorithm_for_key(key), key),
+            )
+
+    @classmethod
+    def from_config(cls, config: AuthJWT) -> "JWTKeyManager":
+        private_key = load_pem_private_key(
+            config.PRIVATE_KEY.read_bytes(),
+            password=None,
+        )
+        public_key = load_pem_public_key(config.PUBLIC_KEY.read_bytes())
+        return cls(
+            private_key=private_key,
+            public_key=public_key,
+            algorithm=config.ALGORITM,
+            key_id=config.KEY_ID,
+            verification_keys=_load_verification_keys(
+                config.VERIFICATION_KEYS_DIR,
+            ),
+        )
+
+    @property
+    def algorithm(self) -> str:
+        return self._algorithm
+
+    def encode(self, payload: dict) -> str:
+        return jwt.encode(
+            payload,
+            self._private_key,
+            algorithm=self._algorithm,
+            headers=self._headers,
+        )
+
+    def decode(self, token: str | bytes) -> dict:
+        kid = jwt.get_unverified_header(token).get("kid")
+        verification_key = self._verification_keys.get(kid)
+        if verification_key is None:
+            raise InvalidTokenError(f"Unknown key id: {kid}")
+
+        algorithm, key = verification_key
+        return jwt.decode(token, key, algorithms=[algorithm])
+
+
+def _load_verification_keys(directory: Path | None) -> dict[str, object]:
+    if directory is None or not directory.exists():
+        return {}
+
+    return {
+        path.stem: load_pem_public_key(path.read_bytes())
+        for path in sorted(directory.glob("*.pem"))
+    }
@@ -1,17 +1,16 @@
 from datetime import UTC, datetime, timedelta
 
-import bcrypt
-import jwt
-
 from entrypoint.config import config
+from utils.jwt_keys import JWTKeyManager
+
+key_manager = JWTKeyManager.from_config(config.auth_jwt)
 
 
 def encode_jwt(
     payload: dict,
-    private_key: str = config.auth_jwt.PRIVATE_KEY.read_text(),
-    algorithm: str = config.auth_jwt.ALGORITM,
     expire_timedelta: timedelta | None = None,
     expire_minutes: int = None,
+    keys: JWTKeyManager = key_manager,
 ):
     to_encode = payload.copy()
     now = datetime.now(UTC)
@@ -29,24 +28,15 @@ def encode_jwt(
         exp=expire,
         iat=now,
     )
-    encoded = jwt.encode(
-        to_encode,
-        private_key,
-        algorithm=algorithm,
-    )
+    encoded = keys.encode(to_encode)
     return encoded
 
 
 def decode_jwt(
     token: str | bytes,
-    public_key: str = config.auth_jwt.PUBLIC_KEY.read_text(),
-    algorithm: str = config.auth_jwt.ALGORITM,
+    keys: JWTKeyManager = key_manager,
 ):
-    decoded = jwt.decode(
-        token,
-        public_key,
-        algorithms=[algorithm],
-    )
+    decoded = keys.decode(token)
     return decoded
 
 
@@ -67,17 +57,3 @@ def create_refresh_token(data: dict) -> str:
             days=config.auth_jwt.REFRESH_TOKEN_EXPIRE_DAYS,
         ),
     )
-
-
-def hash_password(password: str) -> str:
-    salt = bcrypt.gensalt()
-    pwd_bytes: bytes = password.encode()
-    hashed_bytes = bcrypt.hashpw(pwd_bytes, salt)
-    return hashed_bytes.decode("utf-8")
-
-
-def validate_password(password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(
-        password=password.encode(),
-        hashed_password=hashed_password.encode("utf-8"),
-    )
@@ -0,0 +1,43 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_CURSOR_PREFIX = "id:"
+
+
+@dataclass(frozen=True, slots=True)
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None
+
+
+def encode_cursor(last_id: int) -> str:
+    raw = f"{_CURSOR_PREFIX}{last_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError) as err:
+        raise ValueError("Invalid cursor") from err
+
+    if not raw.startswith(_CURSOR_PREFIX):
+        raise ValueError("Invalid cursor")
+    try:
+        return int(raw.removeprefix(_CURSOR_PREFIX))
+    except ValueError as err:
+        raise ValueError("Invalid cursor") from err
+
+
+def make_page(items: list[T], limit: int) -> Page[T]:
+    next_cursor = None
+    if items and len(items) == limit:
+        next_cursor = encode_cursor(items[-1].id)
+    return Page(items=list(items), next_cursor=next_cursor)
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from core.admission.controller import AdmissionController, AdmissionRejected
+from core.admission.priority import Priority
+
+
+def test_no_queue_rejects_once_every_slot_is_taken():
+    controller = AdmissionController(
+        max_in_flight=1,
+        max_queue=0,
+        queue_timeout=1,
+    )
+
+    async def run():
+        await controller.acquire(Priority.NORMAL)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire(Priority.CRITICAL)
+        assert rejected.value.reason == "queue_full"
+        controller.release()
+        # The freed slot is admitted straight away.
+        await controller.acquire(Priority.LOW)
+
+    asyncio.run(run())
+    assert controller.in_flight == 1
+    assert controller.queued == 0
+
+
+def test_negative_queue_size_is_rejected():
+    with pytest.raises(ValueError):
+        AdmissionController(max_in_flight=1, max_queue=-1, queue_timeout=1)
+
+
+def test_higher_priority_sheds_the_newest_lowest_waiter():
+    controller = AdmissionController(
+        max_in_flight=1,
+        max_queue=1,
+        queue_timeout=1,
+    )
+
+    async def run():
+        await controller.acquire(Priority.NORMAL)
+        low = asyncio.create_task(controller.acquire(Priority.LOW))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(controller.acquire(Priority.HIGH))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected):
+            await low
+        controller.release()
+        await high
+
+    asyncio.run(run())
@@ -0,0 +1,120 @@
+import asyncio
+
+from redis.exceptions import ConnectionError, TimeoutError
+
+from core.cache import RedisCache
+from core.metrics import CACHE_REQUESTS_TOTAL
+
+
+class FailingRedis:
+    def __init__(self, exc: Exception):
+        self.exc = exc
+
+    def register_script(self, script):
+        async def run(keys, args):
+            raise self.exc
+
+        return run
+
+    async def hget(self, key, field):
+        raise self.exc
+
+
+class ScriptFailingRedis(FailingRedis):
+    async def hget(self, key, field):
+        return None
+
+
+class FillFailingRedis:
+    def __init__(self):
+        self.scripts = 0
+
+    def register_script(self, script):
+        # RedisCache registers the lock script first, then the fill.
+        self.scripts += 1
+        fails = self.scripts == 2
+
+        async def run(keys, args):
+            if fails:
+                raise ConnectionError("down")
+            return 1
+
+        return run
+
+    async def hget(self, key, field):
+        return None
+
+
+def make_cache(redis) -> RedisCache:
+    return RedisCache(
+        redis,
+        name="test",
+        ttl=60,
+        lock_ttl=2,
+        wait_timeout=0.5,
+    )
+
+
+def errors() -> float:
+    return CACHE_REQUESTS_TOTAL.labels("test", "error")._value.get()
+
+
+def test_get_or_load_falls_back_to_load_when_redis_is_down():
+    cache = make_cache(FailingRedis(ConnectionError("down")))
+    loads = []
+
+    async def load():
+        loads.append(1)
+        return {"id": 1}
+
+    before = errors()
+    value = asyncio.run(cache.get_or_load("message:1", "v", load))
+
+    assert value == {"id": 1}
+    assert loads == [1]
+    assert errors() == before + 1
+
+
+def test_get_or_load_falls_back_when_redis_times_out():
+    cache = make_cache(FailingRedis(TimeoutError("slow")))
+
+    async def load():
+        return [1, 2, 3]
+
+    assert asyncio.run(cache.get_or_load("lists", "f", load)) == [1, 2, 3]
+
+
+def test_get_or_load_falls_back_when_the_lock_script_fails():
+    cache = make_cache(ScriptFailingRedis(OSError("reset")))
+
+    async def load():
+        return "value"
+
+    before = errors()
+    assert asyncio.run(cache.get_or_load("message:2", "v", load)) == "value"
+    assert errors() == before + 1
+
+
+def test_failed_fill_still_returns_the_loaded_value():
+    cache = make_cache(FillFailingRedis())
+
+    async def load():
+        return "fresh"
+
+    before = errors()
+    assert asyncio.run(cache.get_or_load("message:4", "v", load)) == "fresh"
+    assert errors() == before + 1
+
+
+def test_load_errors_are_not_swallowed():
+    cache = make_cache(ScriptFailingRedis(ConnectionError("down")))
+
+    async def load():
+        raise LookupError("row is gone")
+
+    try:
+        asyncio.run(cache.get_or_load("message:3", "v", load))
+    except LookupError:
+        pass
+    else:
+        raise AssertionError("load error was swallowed")
@@ -0,0 +1,68 @@
+import asyncio
+
+from redis.exceptions import ConnectionError
+
+from core.circuit_breaker import BreakerState, CircuitBreaker
+from core.rate_limiter import RateLimiter, RateLimiterUnavailable
+
+WINDOWS = ((5, 60),)
+
+
+class StubRedis:
+    def __init__(self):
+        self.calls = 0
+        self.exc: BaseException | None = None
+        self.started = asyncio.Event()
+
+    def register_script(self, script):
+        async def run(keys, args):
+            self.calls += 1
+            self.started.set()
+            if self.exc is not None:
+                raise self.exc
+            await asyncio.sleep(10)
+
+        return run
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=60)
+    redis = StubRedis()
+    redis.exc = ConnectionError("down")
+    limiter = RateLimiter(redis, timeout=1, breaker=breaker)
+
+    async def check():
+        await limiter.check("client", "/api/ping", WINDOWS)
+
+    for _ in range(3):
+        try:
+            asyncio.run(check())
+        except RateLimiterUnavailable:
+            pass
+
+    assert breaker.state is BreakerState.OPEN
+    assert redis.calls == 2
+
+
+def test_cancelled_probe_is_not_counted_as_a_failure():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0)
+    breaker.record(succeeded=False)
+    redis = StubRedis()
+    limiter = RateLimiter(redis, timeout=1, breaker=breaker)
+
+    async def cancel_probe():
+        task = asyncio.create_task(
+            limiter.check("client", "/api/ping", WINDOWS),
+        )
+        await redis.started.wait()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(cancel_probe())
+
+    assert breaker.state is BreakerState.HALF_OPEN
+    # The abandoned probe is released, so the next call may probe.
+    assert breaker.allow()
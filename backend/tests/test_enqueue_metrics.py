@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+from taskiq import InMemoryBroker
+from taskiq.exceptions import SendTaskError
+
+from core.metrics import EnqueueMetricsMiddleware
+
+
+class FlakyBroker(InMemoryBroker):
+    fail = False
+
+    async def kick(self, message):
+        if self.fail:
+            raise ConnectionError("broker is down")
+        await super().kick(message)
+
+
+broker = FlakyBroker().with_middlewares(EnqueueMetricsMiddleware())
+
+
+@broker.task(task_name="test_enqueue_metrics")
+async def noop() -> None:
+    pass
+
+
+def observed() -> float:
+    return REGISTRY.get_sample_value(
+        "task_enqueue_seconds_count",
+        {"task": "test_enqueue_metrics"},
+    ) or 0
+
+
+def test_only_successful_sends_are_observed():
+    async def run():
+        before = observed()
+        broker.fail = True
+        with pytest.raises(SendTaskError):
+            await noop.kiq()
+        assert observed() == before
+
+        broker.fail = False
+        await noop.kiq()
+        assert observed() == before + 1
+
+    asyncio.run(run())
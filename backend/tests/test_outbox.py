@@ -0,0 +1,20 @@
+from core.outbox import OutboxPublisher
+
+
+def make_publisher(**kwargs) -> OutboxPublisher:
+    return OutboxPublisher(session_factory=None, broker=None, **kwargs)
+
+
+def test_failed_publishes_back_off_exponentially_up_to_the_cap():
+    publisher = make_publisher(max_attempts=10, retry_base=1, retry_max=30)
+
+    delays = [publisher.retry_delay(attempts) for attempts in range(1, 8)]
+
+    assert delays == [1, 2, 4, 8, 16, 30, 30]
+
+
+def test_message_is_dead_lettered_after_max_attempts():
+    publisher = make_publisher(max_attempts=3)
+
+    assert publisher.retry_delay(2) is not None
+    assert publisher.retry_delay(3) is None
@@ -0,0 +1,99 @@
+import asyncio
+
+from core.rate_limiter import (
+    RateLimitMiddleware,
+    RateLimitResult,
+    Strategy,
+    route_policy,
+)
+from utils.jwt_utils import create_access_token
+
+
+class StubRateLimiter:
+    def __init__(self):
+        self.identifiers = []
+
+    async def check(self, identifier, endpoint, windows) -> RateLimitResult:
+        self.identifiers.append(identifier)
+        return RateLimitResult(
+            limited=False,
+            limit=30,
+            remaining=29,
+            retry_after=0,
+            window=1,
+        )
+
+
+async def app(scope, receive, send):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def call(strategy: Strategy, headers: list[tuple[bytes, bytes]]):
+    limiter = StubRateLimiter()
+    middleware = RateLimitMiddleware(
+        app,
+        [route_policy("GET", "/api/ping", "30/s", strategy=strategy)],
+    )
+    middleware._rate_limiter = limiter
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/ping",
+        "headers": headers,
+        "client": ("10.0.0.1", 50000),
+    }
+    asyncio.run(middleware(scope, receive, send))
+    return limiter.identifiers, sent[0]
+
+
+def test_rate_limit_headers_are_added_to_the_response():
+    identifiers, start = call(
+        Strategy.IP,
+        [(b"x-forwarded-for", b"203.0.113.7, 10.0.0.1")],
+    )
+
+    assert identifiers == ["203.0.113.7"]
+    assert start["headers"] == [
+        (b"content-type", b"application/json"),
+        (b"x-ratelimit-limit", b"30"),
+        (b"x-ratelimit-remaining", b"29"),
+        (b"x-ratelimit-reset", b"1"),
+    ]
+
+
+def test_ip_falls_back_to_the_client_address():
+    identifiers, _ = call(Strategy.IP, [])
+
+    assert identifiers == ["10.0.0.1"]
+
+
+def test_user_strategy_reads_the_token_from_the_cookie():
+    token = create_access_token({"sub": "42"})
+    identifiers, _ = call(
+        Strategy.USER,
+        [(b"cookie", f"theme=dark; access_token={token}".encode())],
+    )
+
+    assert identifiers == ["42"]
+
+
+def test_user_strategy_rejects_requests_without_a_token():
+    identifiers, start = call(Strategy.USER, [(b"x-user-id", b"1")])
+
+    assert identifiers == []
+    assert start["status"] == 401
@@ -0,0 +1,155 @@
+import asyncio
+from types import SimpleNamespace
+
+import fakeredis.aioredis
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.integrations.fastapi import FastapiProvider
+from redis.asyncio import Redis
+from starlette.requests import Request
+
+from core.token_version import TokenVersionStore
+from entrypoint.config import Config, create_config
+from entrypoint.ioc import AuthProvider
+from models import RoleEnum
+from schemas.user import UserResponse
+from services.user import UserService
+from utils.jwt_utils import create_access_token
+
+
+class StubUserService:
+    def __init__(self, user):
+        self.user = user
+        self.lookups = 0
+
+    async def get_user_by_id(self, user_id: int):
+        self.lookups += 1
+        return self.user
+
+
+class StubProvider(Provider):
+    def __init__(self, redis: Redis, service: StubUserService):
+        super().__init__()
+        self.redis = redis
+        self.service = service
+
+    @provide(scope=Scope.APP)
+    def get_config(self) -> Config:
+        config = create_config()
+        config.auth_jwt.STATELESS = True
+        return config
+
+    @provide(scope=Scope.APP)
+    def get_redis(self) -> Redis:
+        return self.redis
+
+    @provide(scope=Scope.REQUEST)
+    def get_user_service(self) -> UserService:
+        return self.service
+
+
+class Worker:
+    # One API worker: its own container, so its own TokenCache, sharing
+    # Redis with every other worker.
+    def __init__(self, redis: Redis, service: StubUserService):
+        self.container = make_async_container(
+            AuthProvider(),
+            StubProvider(redis, service),
+            FastapiProvider(),
+        )
+
+    async def authenticate(self, token: str) -> UserResponse:
+        request = Request(
+            {
+                "type": "http",
+                "headers": [(b"authorization", f"Bearer {token}".encode())],
+            }
+        )
+        async with self.container(context={Request: request}) as container:
+            return await container.get(UserResponse)
+
+
+def make_user(token_version: int):
+    return SimpleNamespace(
+        id=1,
+        email="new@example.com",
+        username="user",
+        role=RoleEnum.USER,
+        token_version=token_version,
+    )
+
+
+def make_token(ver: int) -> str:
+    return create_access_token(
+        {
+            "sub": "1",
+            "email": "old@example.com",
+            "username": "user",
+            "role": RoleEnum.USER,
+            "ver": ver,
+        },
+        5,
+    )
+
+
+def test_missing_version_is_unknown_not_zero():
+    service = StubUserService(make_user(token_version=1))
+    worker = Worker(fakeredis.aioredis.FakeRedis(), service)
+
+    # The key was flushed; a token from before the last update must not
+    # be trusted just because it carries the initial version.
+    user = asyncio.run(worker.authenticate(make_token(ver=0)))
+
+    assert service.lookups == 1
+    assert user.email == "new@example.com"
+
+
+def test_database_fallback_reseeds_the_version():
+    redis = fakeredis.aioredis.FakeRedis()
+    service = StubUserService(make_user(token_version=1))
+    token = make_token(ver=1)
+
+    async def run():
+        await Worker(redis, service).authenticate(token)
+        user = await Worker(redis, service).authenticate(token)
+        return user, await TokenVersionStore(redis).get(1)
+
+    user, version = asyncio.run(run())
+
+    assert version == 1
+    assert service.lookups == 1
+    assert user.email == "old@example.com"
+
+
+def test_cached_version_never_moves_backwards():
+    versions = TokenVersionStore(fakeredis.aioredis.FakeRedis())
+
+    async def race():
+        await versions.set(1, 3)
+        await versions.set(1, 2)
+        return await versions.get(1)
+
+    assert asyncio.run(race()) == 3
+
+
+def test_cached_token_is_dropped_once_another_worker_bumps_the_version():
+    redis = fakeredis.aioredis.FakeRedis()
+    service = StubUserService(make_user(token_version=1))
+    worker = Worker(redis, service)
+    token = make_token(ver=1)
+
+    async def run():
+        await worker.authenticate(token)
+        await worker.authenticate(token)
+        assert service.lookups == 1
+
+        # update_user ran on another worker: the row changed and only
+        # the shared version tells this worker about it.
+        service.user = make_user(token_version=2)
+        service.user.role = RoleEnum.ADMIN
+        await TokenVersionStore(redis).set(1, 2)
+        return await worker.authenticate(token)
+
+    user = asyncio.run(run())
+
+    assert service.lookups == 2
+    assert user.role == RoleEnum.ADMIN